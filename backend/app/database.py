@@ -2,6 +2,7 @@
 Database setup and initialization for O9 Test Automation Platform
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -34,10 +35,21 @@ if "sqlite" in DATABASE_URL:
         "timeout": 20  # Increase timeout for concurrent access
     }
 
+# psycopg2 sends non-INSERT executemany calls one statement per row unless
+# its batch helpers are enabled (INSERTs already use insertmanyvalues)
+dialect_kwargs = {}
+if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+    dialect_kwargs = {
+        "executemany_mode": "values_plus_batch",
+        "executemany_batch_page_size": 100
+    }
+
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
-    pool_pre_ping=True  # Verify connections before using
+    pool_pre_ping=True,  # Verify connections before using
+    insertmanyvalues_page_size=1000,  # Rows per multi-VALUES INSERT for bulk inserts
+    **dialect_kwargs
 )
 
 # Create session factory
@@ -7,6 +7,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 import time
 import json
 import os
@@ -21,6 +22,30 @@ try:
 except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
 
+# Checks a list of [locator_type, locator_value] pairs in the page and returns
+# one boolean per pair, so verify_all costs a single WebDriver round-trip
+# instead of one find_element per locator. Unknown types are treated as XPath.
+VERIFY_ALL_SCRIPT = """
+return arguments[0].map(function (locator) {
+    var type = locator[0], value = locator[1];
+    switch (type) {
+        case 'id': return document.getElementById(value) !== null;
+        case 'css': return document.querySelector(value) !== null;
+        case 'class': return document.getElementsByClassName(value).length > 0;
+        case 'name': return document.getElementsByName(value).length > 0;
+        case 'tag': return document.getElementsByTagName(value).length > 0;
+        case 'link_text':
+        case 'partial_link_text':
+            return Array.prototype.some.call(document.links, function (link) {
+                var text = link.textContent.trim();
+                return type === 'link_text' ? text === value : text.indexOf(value) !== -1;
+            });
+        default:
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+    }
+});
+"""
+
 
 class SeleniumExecutor:
     """Manages Selenium browser sessions and executes test commands"""
@@ -29,6 +54,8 @@ class SeleniumExecutor:
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
         self.session_active = False  # Track if browser session is active
+        # (prefix_id, url) of the last navigation prefix completed in this session
+        self.completed_prefix: Optional[tuple] = None
         
     def initialize_browser(self, headless: bool = True):
         """
@@ -54,6 +81,7 @@ class SeleniumExecutor:
                 self.wait = None
                 self.session_active = False
         
+        self.completed_prefix = None
         chrome_options = Options()
         if headless:
             chrome_options.add_argument('--headless')
@@ -165,6 +193,7 @@ class SeleniumExecutor:
             self.driver = None
             self.wait = None
             self.session_active = False
+            self.completed_prefix = None
             print("Browser session closed")
             
     def execute_script(self, script_json: str, emit_callback: Optional[Callable] = None, keep_alive: bool = False) -> Dict[str, Any]:
@@ -246,7 +275,7 @@ class SeleniumExecutor:
                 if 'action' not in cmd:
                     raise ValueError(
                         f"Command {idx+1} missing 'action' field. "
-                        f"Valid actions: navigate, click, input, wait, verify_element_present"
+                        f"Valid actions: navigate, click, input, wait, wait_for_element, verify_element_present, verify_all"
                     )
             
             logger.info(f"✓ Validation passed - executing {len(commands)} JSON commands")
@@ -264,6 +293,14 @@ class SeleniumExecutor:
             for idx, command in enumerate(commands):
                 action = command.get('action')
                 description = command.get('description', action)
+                prefix_id = command.get('prefix_id')
+                
+                # Commands tagged with a prefix_id are a shared navigation path.
+                # When the previous step in this session already ran the same
+                # path and the browser is still on the page it led to, skip it.
+                if prefix_id and self.completed_prefix == (prefix_id, self.driver.current_url):
+                    logger.info(f"Step {idx+1}/{len(commands)}: skipped, already at end of '{prefix_id}' path")
+                    continue
                 
                 # Log the command
                 logger.info(f"Step {idx+1}/{len(commands)}: {action} - {description}")
@@ -285,6 +322,10 @@ class SeleniumExecutor:
                 # Execute command
                 self._execute_command(command)
                 
+                # Remember where a navigation prefix ended for the next step
+                if prefix_id and (idx + 1 == len(commands) or commands[idx + 1].get('prefix_id') != prefix_id):
+                    self.completed_prefix = (prefix_id, self.driver.current_url)
+                
                 # Capture screenshot for live view
                 if emit_callback and self.driver:
                     try:
@@ -408,6 +449,31 @@ class SeleniumExecutor:
                 raise ValueError(f"wait action requires valid 'duration' (number >= 0), got: {duration}")
             time.sleep(duration)
             
+        elif action == 'wait_for_element':
+            locator_type = command.get('locator_type')
+            locator_value = command.get('locator_value')
+            expected_text = command.get('expected_text')
+            timeout = command.get('timeout', 10)
+            
+            if not locator_type or not locator_value:
+                raise ValueError("wait_for_element requires 'locator_type' and 'locator_value' fields")
+            if not isinstance(timeout, (int, float)) or timeout <= 0:
+                raise ValueError(f"wait_for_element requires valid 'timeout' (number > 0), got: {timeout}")
+            
+            # Returns as soon as the element is visible (or contains expected_text),
+            # unlike a fixed 'wait' which always sleeps its full duration
+            locator = (self._get_by(locator_type), locator_value)
+            if expected_text:
+                condition = EC.text_to_be_present_in_element(locator, expected_text)
+            else:
+                condition = EC.visibility_of_element_located(locator)
+            
+            try:
+                WebDriverWait(self.driver, timeout).until(condition)
+            except TimeoutException:
+                target = f"text '{expected_text}' in" if expected_text else "visible"
+                raise AssertionError(f"Timed out after {timeout}s waiting for {target} {locator_type}={locator_value}")
+            
         elif action == 'verify_element_present':
             locator_type = command.get('locator_type')
             locator_value = command.get('locator_value')
@@ -418,6 +484,32 @@ class SeleniumExecutor:
             # If _find_element succeeds, element is present
             self._find_element(locator_type, locator_value)
             
+        elif action == 'verify_all':
+            locators = command.get('locators')
+            
+            if not isinstance(locators, list) or not locators:
+                raise ValueError("verify_all requires a non-empty 'locators' list")
+            
+            pairs = []
+            for locator in locators:
+                if not isinstance(locator, dict) or not locator.get('locator_type') or not locator.get('locator_value'):
+                    raise ValueError("verify_all locators each require 'locator_type' and 'locator_value' fields")
+                pairs.append([locator['locator_type'].lower(), locator['locator_value']])
+            
+            # Poll the whole batch with one execute_script per attempt, giving the
+            # page the same 10 seconds as verify_element_present to render
+            found = []
+            
+            def all_present(driver):
+                found[:] = driver.execute_script(VERIFY_ALL_SCRIPT, pairs)
+                return all(found)
+            
+            try:
+                self.wait.until(all_present)
+            except TimeoutException:
+                missing = [f"{locator_type}={locator_value}" for (locator_type, locator_value), present in zip(pairs, found) if not present]
+                raise AssertionError(f"Elements not present: {', '.join(missing)}")
+            
         elif action == 'verify_text':
             locator_type = command.get('locator_type')
             locator_value = command.get('locator_value')
@@ -434,10 +526,10 @@ class SeleniumExecutor:
                 raise AssertionError(f"Expected text '{expected_text}' not found. Got: '{actual_text}'")
             
         else:
-            raise ValueError(f"Unknown action type: {action}. Supported actions: navigate, click, input, wait, verify_element_present, verify_text")
+            raise ValueError(f"Unknown action type: {action}. Supported actions: navigate, click, input, wait, wait_for_element, verify_element_present, verify_all, verify_text")
     
-    def _find_element(self, locator_type: str, locator_value: str):
-        """Find element using specified locator strategy"""
+    def _get_by(self, locator_type: str) -> str:
+        """Map a JSON locator_type to a Selenium By strategy (XPath if unknown)"""
         by_mapping = {
             'id': By.ID,
             'xpath': By.XPATH,
@@ -449,7 +541,11 @@ class SeleniumExecutor:
             'partial_link_text': By.PARTIAL_LINK_TEXT
         }
         
-        by = by_mapping.get(locator_type.lower(), By.XPATH)
+        return by_mapping.get(locator_type.lower(), By.XPATH)
+    
+    def _find_element(self, locator_type: str, locator_value: str):
+        """Find element using specified locator strategy"""
+        by = self._get_by(locator_type)
         return self.wait.until(EC.presence_of_element_located((by, locator_value)))
     
     def generate_python_script(self, script_json: str) -> str:
@@ -491,6 +587,15 @@ class SeleniumExecutor:
                 duration = command.get('duration', 1)
                 python_lines.append(f"time.sleep({duration})")
                 
+            elif action == 'wait_for_element':
+                locator = self._format_locator_python(command.get('locator_type'), command.get('locator_value'))
+                timeout = command.get('timeout', 10)
+                if command.get('expected_text'):
+                    expected = command.get('expected_text').replace("'", "\\'")
+                    python_lines.append(f"WebDriverWait(driver, {timeout}).until(EC.text_to_be_present_in_element({locator}, '{expected}'))")
+                else:
+                    python_lines.append(f"WebDriverWait(driver, {timeout}).until(EC.visibility_of_element_located({locator}))")
+                
             elif action == 'verify_text':
                 locator = self._format_locator_python(command.get('locator_type'), command.get('locator_value'))
                 expected = command.get('expected_text', '').replace("'", "\\'")
@@ -500,6 +605,11 @@ class SeleniumExecutor:
             elif action == 'verify_element_present':
                 locator = self._format_locator_python(command.get('locator_type'), command.get('locator_value'))
                 python_lines.append(f"wait.until(EC.presence_of_element_located({locator}))")
+                
+            elif action == 'verify_all':
+                for locator in command.get('locators', []):
+                    locator = self._format_locator_python(locator.get('locator_type', '').lower(), locator.get('locator_value'))
+                    python_lines.append(f"wait.until(EC.presence_of_element_located({locator}))")
             
             python_lines.append("")
         
@@ -7,6 +7,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
+from app.services.selenium_executor import VERIFY_ALL_SCRIPT
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -293,10 +295,55 @@ class SeleniumService:
             await asyncio.sleep(duration)
             return f"Waited {duration} seconds"
         
+        elif action == 'wait_for_element':
+            locator = self._get_locator(command)
+            expected = command.get('expected_text')
+            timeout = command.get('timeout', 10)
+            if not isinstance(timeout, (int, float)) or timeout <= 0:
+                raise ValueError(f"wait_for_element requires valid 'timeout' (number > 0), got: {timeout}")
+            
+            if expected:
+                condition = EC.text_to_be_present_in_element(locator, expected)
+            else:
+                condition = EC.visibility_of_element_located(locator)
+            
+            try:
+                WebDriverWait(driver, timeout).until(condition)
+            except TimeoutException:
+                raise Exception(f"Timed out after {timeout}s waiting for {locator[1]}")
+            return f"Element ready: {locator[1]}"
+        
         elif action == 'verify_element_present':
             element = self._find_element(driver, command)
             return f"Element verified present"
         
+        elif action == 'verify_all':
+            locators = command.get('locators')
+            if not isinstance(locators, list) or not locators:
+                raise ValueError("verify_all requires a non-empty 'locators' list")
+            
+            pairs = []
+            for locator in locators:
+                if not isinstance(locator, dict) or not locator.get('locator_type') or not locator.get('locator_value'):
+                    raise ValueError("verify_all locators each require 'locator_type' and 'locator_value' fields")
+                locator_type = locator['locator_type'].lower()
+                # _get_locator rejects unknown locator types before the batch runs
+                self._get_locator({'locator_type': locator_type, 'locator_value': locator['locator_value']})
+                pairs.append([locator_type, locator['locator_value']])
+            
+            found = []
+            
+            def all_present(driver):
+                found[:] = driver.execute_script(VERIFY_ALL_SCRIPT, pairs)
+                return all(found)
+            
+            try:
+                WebDriverWait(driver, 10).until(all_present)
+            except TimeoutException:
+                missing = [value for (_, value), present in zip(pairs, found) if not present]
+                raise Exception(f"Elements not present: {', '.join(missing)}")
+            return f"Verified {len(pairs)} elements present"
+        
         elif action == 'verify_text':
             element = self._find_element(driver, command)
             expected = command.get('expected_text', '')
@@ -314,8 +361,8 @@ class SeleniumService:
         else:
             raise Exception(f"Unknown action: {action}")
     
-    def _find_element(self, driver: webdriver.Chrome, command: dict):
-        """Find element based on locator type and value"""
+    def _get_locator(self, command: dict) -> tuple:
+        """Build a (By, value) locator from a command's locator fields"""
         locator_type = command.get('locator_type', 'id')
         locator_value = command.get('locator_value')
         
@@ -337,8 +384,12 @@ class SeleniumService:
         if not by_type:
             raise Exception(f"Invalid locator_type: {locator_type}")
         
+        return (by_type, locator_value)
+    
+    def _find_element(self, driver: webdriver.Chrome, command: dict):
+        """Find element based on locator type and value"""
         wait = WebDriverWait(driver, 10)
-        return wait.until(EC.presence_of_element_located((by_type, locator_value)))
+        return wait.until(EC.presence_of_element_located(self._get_locator(command)))
     
     def _take_screenshot(self, driver: webdriver.Chrome, step_id: int, suffix: str = '') -> str:
         """Take screenshot and save to disk - DISABLED"""
@@ -189,7 +189,7 @@ async def handle_execute_step(websocket: WebSocket, step_id: int, db: Session):
                 if 'action' not in cmd:
                     raise ValueError(
                         f"Command {idx+1} missing 'action' field. "
-                        f"Valid actions: navigate, click, input, wait, verify_element_present"
+                        f"Valid actions: navigate, click, input, wait, wait_for_element, verify_element_present, verify_all"
                     )
             
             logger.info(f"✓ JSON validation passed for step {step_id}")
@@ -6,653 +6,380 @@ All steps are guaranteed to work with the Mock O9 website
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from app.database import SessionLocal, init_db
-from app.models import TestCase, TestStep, TestCaseStatus, TestStepStatus, ExecutionStatus
 import json
+import logging
+import textwrap
+from contextlib import nullcontext
+from functools import lru_cache
+from string import Template
 
-def create_comprehensive_test():
-    """Create a complete 12-step test case for O9 Platform"""
-    
-    init_db()
-    db = SessionLocal()
-    
-    try:
-        # Check if test already exists
-        existing = db.query(TestCase).filter(
-            TestCase.name == "Mock O9 - Complete Workflow Test"
-        ).first()
-        
-        if existing:
-            print(f"Test case already exists: ID {existing.id}")
-            print("Delete it first if you want to recreate it")
-            return existing.id
-        
-        # Create test case
-        tc = TestCase(
-            name="Mock O9 - Complete Workflow Test",
-            description="Comprehensive end-to-end test of O9 Platform including login, navigation, forecast generation, filter application, BOM setup, and data validation. This test covers 12 steps across all major modules.",
-            status=TestCaseStatus.APPROVED,
-            requirements="Mock O9 website running on http://localhost:3001",
-            assigned_to="Test Automation Team"
+# Use the C-implemented orjson encoder when it's installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TEST_CASE_NAME = "Mock O9 - Complete Workflow Test"
+
+BAR = "=" * 80
+
+# Building blocks for the display-only Python scripts shown next to each step.
+# The templates are parsed once at import and filled in per step.
+SCRIPT_HEADER = "# Python script for display only"
+SCRIPT_TEMPLATES = {
+    "click_link": Template(
+        "$var = driver.find_element(By.XPATH, \"//a[contains(text(), '$text')]\")\n"
+        "$var.click()"
+    ),
+    "select_option": Template(
+        "$var = driver.find_element(By.ID, '$id')\n"
+        "$var.click()\n"
+        "$option_var = driver.find_element(By.XPATH, \"//select[@id='$id']/option[@value='$value']\")\n"
+        "$option_var.click()"
+    ),
+    "verify_displayed": Template(
+        "$var = driver.find_element(By.CLASS_NAME, '$cls')\n"
+        "assert $var.is_displayed()"
+    ),
+}
+
+# Fields the executor requires for each supported action
+REQUIRED_FIELDS = {
+    "navigate": ("url",),
+    "wait": ("duration",),
+    "click": ("locator_type", "locator_value"),
+    "input": ("locator_type", "locator_value", "text"),
+    "verify_element_present": ("locator_type", "locator_value"),
+    "verify_text": ("locator_type", "locator_value", "expected_text"),
+    "wait_for_element": ("locator_type", "locator_value"),
+    "verify_all": ("locators",),
+}
+
+
+def _dumps(commands):
+    """Serialize a step's JSON commands for selenium_script_json"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(commands, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(commands, indent=2)
+
+
+def _validate_commands(step_name, commands):
+    """Raise ValueError if any command has an unknown action or lacks a required field"""
+    for idx, command in enumerate(commands, 1):
+        action = command.get("action")
+        if action not in REQUIRED_FIELDS:
+            raise ValueError(f"Step '{step_name}' command {idx}: unknown action {action!r}")
+        missing = [field for field in REQUIRED_FIELDS[action] if field not in command]
+        if missing:
+            raise ValueError(f"Step '{step_name}' command {idx} ({action}) missing: {', '.join(missing)}")
+
+
+# JSON commands for each step, keyed by step name. Kept in a data file next to
+# this script, then validated and serialized for selenium_script_json once at
+# import rather than on every call.
+STEPS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "comprehensive_test_steps.json")
+with open(STEPS_FILE, "rb") as f:
+    STEP_COMMANDS = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.loads(f.read())
+
+STEP_SCRIPT_JSON = {}
+for _name, _commands in STEP_COMMANDS.items():
+    _validate_commands(_name, _commands)
+    STEP_SCRIPT_JSON[_name] = _dumps(_commands)
+
+
+def _script(*lines):
+    """Join display-script lines under the standard header"""
+    return "\n".join((SCRIPT_HEADER,) + lines)
+
+
+# The 12 steps of the workflow, in execution order. "name" is used for progress
+# output and to look up the step's serialized commands in STEP_SCRIPT_JSON.
+STEPS = [
+    # STEP 1: Login to O9 Platform
+    {
+        "name": "Login",
+        "description": "Login to O9 Platform\n\nNavigate to the O9 login page at http://localhost:3001 and authenticate using valid credentials (testuser / password123). Verify successful redirect to the main dashboard with the welcome message displayed.",
+        "expected_result": "User successfully logs into the O9 platform. The dashboard page loads and displays 'Welcome to O9 Platform' heading. Navigation menu is visible on the left side.",
+        "selenium_script": _script(
+            "# System executes JSON commands",
+            "from selenium import webdriver",
+            "driver = webdriver.Chrome()",
+            "driver.get('http://localhost:3001')",
+            "username = driver.find_element(By.ID, 'username')",
+            "username.send_keys('testuser')",
+            "password = driver.find_element(By.ID, 'password')",
+            "password.send_keys('password123')",
+            "login_btn = driver.find_element(By.ID, 'login-button')",
+            "login_btn.click()"
         )
-        db.add(tc)
-        db.flush()
-        
-        print(f"\n{'='*80}")
-        print(f"Creating comprehensive test case: {tc.name}")
-        print(f"Test Case ID: {tc.id}")
-        print(f"{'='*80}\n")
-        
-        # ===================================================================
-        # STEP 1: Login to O9 Platform
-        # ===================================================================
-        step1_json = json.dumps([
-            {
-                "action": "navigate",
-                "url": "http://localhost:3001",
-                "description": "Navigate to Mock O9 login page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page to fully load"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "username",
-                "description": "Verify username field exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "password",
-                "description": "Verify password field exists"
-            },
-            {
-                "action": "input",
-                "locator_type": "id",
-                "locator_value": "username",
-                "text": "testuser",
-                "description": "Enter username: testuser"
-            },
-            {
-                "action": "input",
-                "locator_type": "id",
-                "locator_value": "password",
-                "text": "password123",
-                "description": "Enter password: password123"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "login-button",
-                "description": "Click the login button"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for login redirect"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Welcome to O9 Platform",
-                "description": "Verify successful login and dashboard display"
-            }
-        ], indent=2)
-        
-        step1 = TestStep(
-            test_case_id=tc.id,
-            step_number=1,
-            description="Login to O9 Platform\n\nNavigate to the O9 login page at http://localhost:3001 and authenticate using valid credentials (testuser / password123). Verify successful redirect to the main dashboard with the welcome message displayed.",
-            expected_result="User successfully logs into the O9 platform. The dashboard page loads and displays 'Welcome to O9 Platform' heading. Navigation menu is visible on the left side.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\n# System executes JSON commands\nfrom selenium import webdriver\ndriver = webdriver.Chrome()\ndriver.get('http://localhost:3001')\nusername = driver.find_element(By.ID, 'username')\nusername.send_keys('testuser')\npassword = driver.find_element(By.ID, 'password')\npassword.send_keys('password123')\nlogin_btn = driver.find_element(By.ID, 'login-button')\nlogin_btn.click()",
-            selenium_script_json=step1_json
+    },
+    # STEP 2: Verify Dashboard Widgets
+    {
+        "name": "Verify Dashboard",
+        "description": "Verify Dashboard Components\n\nOn the dashboard page, verify that all essential UI components are present including the dashboard widgets container, individual widgets displaying metrics, and the navigation sidebar with menu options.",
+        "expected_result": "Dashboard displays properly with all widgets visible (Demand Planning, Supply Planning, Inventory). Navigation sidebar is present with expandable menu structure. All UI elements are rendered correctly.",
+        "selenium_script": _script(
+            "from selenium.webdriver.common.by import By",
+            SCRIPT_TEMPLATES["verify_displayed"].substitute(var="widgets", cls="dashboard-widgets"),
+            SCRIPT_TEMPLATES["verify_displayed"].substitute(var="sidebar", cls="sidebar")
         )
-        db.add(step1)
-        print("✓ Step 1: Login")
-        
-        # ===================================================================
-        # STEP 2: Verify Dashboard Widgets
-        # ===================================================================
-        step2_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for dashboard to fully render"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "dashboard-widgets",
-                "description": "Verify dashboard widgets container exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "widget",
-                "description": "Verify at least one widget is present"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "sidebar",
-                "description": "Verify navigation sidebar exists"
-            }
-        ], indent=2)
-        
-        step2 = TestStep(
-            test_case_id=tc.id,
-            step_number=2,
-            description="Verify Dashboard Components\n\nOn the dashboard page, verify that all essential UI components are present including the dashboard widgets container, individual widgets displaying metrics, and the navigation sidebar with menu options.",
-            expected_result="Dashboard displays properly with all widgets visible (Demand Planning, Supply Planning, Inventory). Navigation sidebar is present with expandable menu structure. All UI elements are rendered correctly.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nfrom selenium.webdriver.common.by import By\nwidgets = driver.find_element(By.CLASS_NAME, 'dashboard-widgets')\nassert widgets.is_displayed()\nsidebar = driver.find_element(By.CLASS_NAME, 'sidebar')\nassert sidebar.is_displayed()",
-            selenium_script_json=step2_json
+    },
+    # STEP 3: Navigate to Demand Analyst Menu
+    {
+        "name": "Expand Demand Analyst",
+        "description": "Navigate to Demand Analyst Module\n\nFrom the dashboard, locate the Demand Analyst menu item in the left navigation sidebar and click it to expand the submenu. Verify that the submenu appears with options for System Forecast and other demand planning functions.",
+        "expected_result": "Demand Analyst submenu expands successfully, displaying nested menu options including 'System Forecast' and other demand planning modules. Submenu remains open and visible.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["click_link"].substitute(var="demand", text="Demand Analyst"),
+            "time.sleep(1)",
+            "submenu = driver.find_element(By.ID, 'demand-analyst')",
+            "assert 'active' in submenu.get_attribute('class')"
         )
-        db.add(step2)
-        print("✓ Step 2: Verify Dashboard")
-        
-        # ===================================================================
-        # STEP 3: Navigate to Demand Analyst Menu
-        # ===================================================================
-        step3_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait before navigation"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Demand Analyst')]",
-                "description": "Click on Demand Analyst menu item"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu to expand"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "demand-analyst",
-                "description": "Verify Demand Analyst submenu is visible"
-            }
-        ], indent=2)
-        
-        step3 = TestStep(
-            test_case_id=tc.id,
-            step_number=3,
-            description="Navigate to Demand Analyst Module\n\nFrom the dashboard, locate the Demand Analyst menu item in the left navigation sidebar and click it to expand the submenu. Verify that the submenu appears with options for System Forecast and other demand planning functions.",
-            expected_result="Demand Analyst submenu expands successfully, displaying nested menu options including 'System Forecast' and other demand planning modules. Submenu remains open and visible.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\ndemand = driver.find_element(By.XPATH, \"//a[contains(text(), 'Demand Analyst')]\")\ndemand.click()\ntime.sleep(1)\nsubmenu = driver.find_element(By.ID, 'demand-analyst')\nassert 'active' in submenu.get_attribute('class')",
-            selenium_script_json=step3_json
+    },
+    # STEP 4: Navigate to System Forecast
+    {
+        "name": "Expand System Forecast",
+        "description": "Expand System Forecast Submenu\n\nWithin the Demand Analyst menu, click on the 'System Forecast' option to expand its nested submenu. This should reveal additional options including 'Generate Forecast'.",
+        "expected_result": "System Forecast submenu expands, showing nested options. 'Generate Forecast' option becomes visible and clickable within the expanded submenu structure.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["click_link"].substitute(var="system_forecast", text="System Forecast"),
+            "time.sleep(1)"
         )
-        db.add(step3)
-        print("✓ Step 3: Expand Demand Analyst")
-        
-        # ===================================================================
-        # STEP 4: Navigate to System Forecast
-        # ===================================================================
-        step4_json = json.dumps([
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'System Forecast')]",
-                "description": "Click System Forecast submenu"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu expansion"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "system-forecast",
-                "description": "Verify System Forecast submenu appears"
-            }
-        ], indent=2)
-        
-        step4 = TestStep(
-            test_case_id=tc.id,
-            step_number=4,
-            description="Expand System Forecast Submenu\n\nWithin the Demand Analyst menu, click on the 'System Forecast' option to expand its nested submenu. This should reveal additional options including 'Generate Forecast'.",
-            expected_result="System Forecast submenu expands, showing nested options. 'Generate Forecast' option becomes visible and clickable within the expanded submenu structure.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nsystem_forecast = driver.find_element(By.XPATH, \"//a[contains(text(), 'System Forecast')]\")\nsystem_forecast.click()\ntime.sleep(1)",
-            selenium_script_json=step4_json
+    },
+    # STEP 5: Navigate to Generate Forecast
+    {
+        "name": "Expand Generate Forecast",
+        "description": "Expand Generate Forecast Options\n\nClick on 'Generate Forecast' within the System Forecast submenu to reveal the final level of navigation options, including the 'Details' page link.",
+        "expected_result": "Generate Forecast submenu expands successfully. 'Details' link becomes visible as a navigation option. Menu structure maintains proper hierarchy with all parent menus still expanded.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["click_link"].substitute(var="generate", text="Generate Forecast"),
+            "time.sleep(1)"
         )
-        db.add(step4)
-        print("✓ Step 4: Expand System Forecast")
-        
-        # ===================================================================
-        # STEP 5: Navigate to Generate Forecast
-        # ===================================================================
-        step5_json = json.dumps([
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Generate Forecast')]",
-                "description": "Click Generate Forecast option"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "generate-forecast",
-                "description": "Verify Generate Forecast submenu visible"
-            }
-        ], indent=2)
-        
-        step5 = TestStep(
-            test_case_id=tc.id,
-            step_number=5,
-            description="Expand Generate Forecast Options\n\nClick on 'Generate Forecast' within the System Forecast submenu to reveal the final level of navigation options, including the 'Details' page link.",
-            expected_result="Generate Forecast submenu expands successfully. 'Details' link becomes visible as a navigation option. Menu structure maintains proper hierarchy with all parent menus still expanded.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\ngenerate = driver.find_element(By.XPATH, \"//a[contains(text(), 'Generate Forecast')]\")\ngenerate.click()\ntime.sleep(1)",
-            selenium_script_json=step5_json
+    },
+    # STEP 6: Navigate to Forecast Details Page
+    {
+        "name": "Navigate to Forecast Details",
+        "description": "Navigate to Forecast Details Page\n\nClick the 'Details' link under Generate Forecast to navigate to the main forecast analysis page. Verify that the page loads successfully with the heading 'Generate Forecast - Details' and that the scope filters section is present.",
+        "expected_result": "Forecast Details page loads successfully. Page heading displays 'Generate Forecast - Details'. Scope filters section is visible with dropdowns for Forecast Iteration, Channel, Region, and Version. Review and Gap widgets are present on the page.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["click_link"].substitute(var="details", text="Details"),
+            "time.sleep(2)",
+            "assert 'forecast.html' in driver.current_url"
         )
-        db.add(step5)
-        print("✓ Step 5: Expand Generate Forecast")
-        
-        # ===================================================================
-        # STEP 6: Navigate to Forecast Details Page
-        # ===================================================================
-        step6_json = json.dumps([
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Details')]",
-                "description": "Click Details link to navigate to forecast page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page navigation and load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Generate Forecast",
-                "description": "Verify forecast page heading"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "scope-filters",
-                "description": "Verify scope filters section exists"
-            }
-        ], indent=2)
-        
-        step6 = TestStep(
-            test_case_id=tc.id,
-            step_number=6,
-            description="Navigate to Forecast Details Page\n\nClick the 'Details' link under Generate Forecast to navigate to the main forecast analysis page. Verify that the page loads successfully with the heading 'Generate Forecast - Details' and that the scope filters section is present.",
-            expected_result="Forecast Details page loads successfully. Page heading displays 'Generate Forecast - Details'. Scope filters section is visible with dropdowns for Forecast Iteration, Channel, Region, and Version. Review and Gap widgets are present on the page.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\ndetails = driver.find_element(By.XPATH, \"//a[contains(text(), 'Details')]\")\ndetails.click()\ntime.sleep(2)\nassert 'forecast.html' in driver.current_url",
-            selenium_script_json=step6_json
+    },
+    # STEP 7: Apply Forecast Iteration Filter
+    {
+        "name": "Select Forecast Iteration",
+        "description": "Apply Forecast Iteration Filter\n\nOn the Forecast Details page, locate the 'Forecast Iteration' dropdown in the scope filters section. Click the dropdown and select 'Short Term' from the available options.",
+        "expected_result": "Forecast Iteration dropdown opens successfully and displays all available options (Short Term, Mid Term, Long Term). 'Short Term' is selected successfully. The dropdown value updates to reflect the selection.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["select_option"].substitute(var="iteration", id="forecast-iteration", option_var="short_term", value="short-term")
         )
-        db.add(step6)
-        print("✓ Step 6: Navigate to Forecast Details")
-        
-        # ===================================================================
-        # STEP 7: Apply Forecast Iteration Filter
-        # ===================================================================
-        step7_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for page elements to stabilize"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "forecast-iteration",
-                "description": "Click Forecast Iteration dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='forecast-iteration']/option[@value='short-term']",
-                "description": "Select 'Short Term' option"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after selection"
-            }
-        ], indent=2)
-        
-        step7 = TestStep(
-            test_case_id=tc.id,
-            step_number=7,
-            description="Apply Forecast Iteration Filter\n\nOn the Forecast Details page, locate the 'Forecast Iteration' dropdown in the scope filters section. Click the dropdown and select 'Short Term' from the available options.",
-            expected_result="Forecast Iteration dropdown opens successfully and displays all available options (Short Term, Mid Term, Long Term). 'Short Term' is selected successfully. The dropdown value updates to reflect the selection.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\niteration = driver.find_element(By.ID, 'forecast-iteration')\niteration.click()\nshort_term = driver.find_element(By.XPATH, \"//select[@id='forecast-iteration']/option[@value='short-term']\")\nshort_term.click()",
-            selenium_script_json=step7_json
+    },
+    # STEP 8: Apply Region Filter
+    {
+        "name": "Select Region",
+        "description": "Apply Region Filter\n\nContinuing with filter selection, locate the 'Region' dropdown in the scope filters section. Click it and select 'North America' from the available regional options.",
+        "expected_result": "Region dropdown opens and displays all available regions (North America, Europe, Asia). 'North America' is selected successfully. The filter value updates to show the selected region.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["select_option"].substitute(var="region", id="region", option_var="na", value="na")
         )
-        db.add(step7)
-        print("✓ Step 7: Select Forecast Iteration")
-        
-        # ===================================================================
-        # STEP 8: Apply Region Filter
-        # ===================================================================
-        step8_json = json.dumps([
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "region",
-                "description": "Click Region dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='region']/option[@value='na']",
-                "description": "Select 'North America' option"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after selection"
-            }
-        ], indent=2)
-        
-        step8 = TestStep(
-            test_case_id=tc.id,
-            step_number=8,
-            description="Apply Region Filter\n\nContinuing with filter selection, locate the 'Region' dropdown in the scope filters section. Click it and select 'North America' from the available regional options.",
-            expected_result="Region dropdown opens and displays all available regions (North America, Europe, Asia). 'North America' is selected successfully. The filter value updates to show the selected region.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nregion = driver.find_element(By.ID, 'region')\nregion.click()\nna = driver.find_element(By.XPATH, \"//select[@id='region']/option[@value='na']\")\nna.click()",
-            selenium_script_json=step8_json
+    },
+    # STEP 9: Verify Widgets Display
+    {
+        "name": "Verify Widgets",
+        "description": "Verify Forecast Widgets Display\n\nAfter applying filters, verify that both the Review Widget and Gap Widget are properly displayed on the page. Check that the Gap Widget contains a data table with forecast information.",
+        "expected_result": "Both widgets are visible and properly rendered. Review Widget displays with a chart placeholder. Gap Widget shows a data table with columns for Item, Forecast, Last Cycle, and Gap %. Sample data is visible in the table.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["verify_displayed"].substitute(var="review", cls="review-widget"),
+            SCRIPT_TEMPLATES["verify_displayed"].substitute(var="gap", cls="gap-widget")
         )
-        db.add(step8)
-        print("✓ Step 8: Select Region")
-        
-        # ===================================================================
-        # STEP 9: Verify Widgets Display
-        # ===================================================================
-        step9_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for widgets to render"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "review-widget",
-                "description": "Verify Review Widget is present"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "gap-widget",
-                "description": "Verify Gap Widget is present"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "data-table",
-                "description": "Verify data table exists in Gap Widget"
-            }
-        ], indent=2)
-        
-        step9 = TestStep(
-            test_case_id=tc.id,
-            step_number=9,
-            description="Verify Forecast Widgets Display\n\nAfter applying filters, verify that both the Review Widget and Gap Widget are properly displayed on the page. Check that the Gap Widget contains a data table with forecast information.",
-            expected_result="Both widgets are visible and properly rendered. Review Widget displays with a chart placeholder. Gap Widget shows a data table with columns for Item, Forecast, Last Cycle, and Gap %. Sample data is visible in the table.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nreview = driver.find_element(By.CLASS_NAME, 'review-widget')\nassert review.is_displayed()\ngap = driver.find_element(By.CLASS_NAME, 'gap-widget')\nassert gap.is_displayed()",
-            selenium_script_json=step9_json
+    },
+    # STEP 10: Navigate to BOM Setup (Supply Planning)
+    {
+        "name": "Navigate to BOM Setup",
+        "description": "Navigate to BOM Setup Page\n\nReturn to the dashboard and navigate through Supply Master Planning > Manage Network > Manufacturing Network > BOM Setup. Verify that the BOM Setup page loads successfully with global filters and the Produced Items table.",
+        "expected_result": "BOM Setup page loads successfully with heading 'BOM Setup'. Global filters section displays with Version and Item input fields. Produced Items table is visible showing sample BOM data. Actions column contains links to view consumed items.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["click_link"].substitute(var="back", text="Back to Dashboard"),
+            "time.sleep(2)",
+            SCRIPT_TEMPLATES["click_link"].substitute(var="supply", text="Supply Master Planning")
         )
-        db.add(step9)
-        print("✓ Step 9: Verify Widgets")
-        
-        # ===================================================================
-        # STEP 10: Navigate to BOM Setup (Supply Planning)
-        # ===================================================================
-        step10_json = json.dumps([
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), '← Back to Dashboard')]",
-                "description": "Click back to dashboard link"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for dashboard to load"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Supply Master Planning')]",
-                "description": "Expand Supply Master Planning menu"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Manage Network')]",
-                "description": "Expand Manage Network submenu"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'Manufacturing Network')]",
-                "description": "Expand Manufacturing Network submenu"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(text(), 'BOM Setup')]",
-                "description": "Click BOM Setup link"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "BOM Setup",
-                "description": "Verify BOM Setup page loaded"
-            }
-        ], indent=2)
-        
-        step10 = TestStep(
-            test_case_id=tc.id,
-            step_number=10,
-            description="Navigate to BOM Setup Page\n\nReturn to the dashboard and navigate through Supply Master Planning > Manage Network > Manufacturing Network > BOM Setup. Verify that the BOM Setup page loads successfully with global filters and the Produced Items table.",
-            expected_result="BOM Setup page loads successfully with heading 'BOM Setup'. Global filters section displays with Version and Item input fields. Produced Items table is visible showing sample BOM data. Actions column contains links to view consumed items.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nback = driver.find_element(By.XPATH, \"//a[contains(text(), 'Back to Dashboard')]\")\nback.click()\ntime.sleep(2)\nsupply = driver.find_element(By.XPATH, \"//a[contains(text(), 'Supply Master Planning')]\")\nsupply.click()",
-            selenium_script_json=step10_json
-        )
-        db.add(step10)
-        print("✓ Step 10: Navigate to BOM Setup")
-        
-        # ===================================================================
-        # STEP 11: Apply BOM Filters
-        # ===================================================================
-        step11_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for page stabilization"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "version-bom",
-                "description": "Click Version dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='version-bom']/option[@value='current']",
-                "description": "Select CurrentWorkingView"
-            },
-            {
-                "action": "input",
-                "locator_type": "id",
-                "locator_value": "item",
-                "text": "440000849200",
-                "description": "Enter item ID in filter"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after entering item"
-            }
-        ], indent=2)
-        
-        step11 = TestStep(
-            test_case_id=tc.id,
-            step_number=11,
-            description="Apply BOM Global Filters\n\nOn the BOM Setup page, apply global filters by selecting 'CurrentWorkingView' from the Version dropdown and entering item ID '440000849200' in the Item input field. This filters the BOM data to show only relevant items.",
-            expected_result="Version filter successfully set to 'CurrentWorkingView'. Item ID '440000849200' is entered in the Item field. The filters are ready to be applied to retrieve BOM configuration data.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\nversion = driver.find_element(By.ID, 'version-bom')\nversion.click()\ncurrent = driver.find_element(By.XPATH, \"//select[@id='version-bom']/option[@value='current']\")\ncurrent.click()\nitem = driver.find_element(By.ID, 'item')\nitem.send_keys('440000849200')",
-            selenium_script_json=step11_json
+    },
+    # STEP 11: Apply BOM Filters
+    {
+        "name": "Apply BOM Filters",
+        "description": "Apply BOM Global Filters\n\nOn the BOM Setup page, apply global filters by selecting 'CurrentWorkingView' from the Version dropdown and entering item ID '440000849200' in the Item input field. This filters the BOM data to show only relevant items.",
+        "expected_result": "Version filter successfully set to 'CurrentWorkingView'. Item ID '440000849200' is entered in the Item field. The filters are ready to be applied to retrieve BOM configuration data.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["select_option"].substitute(var="version", id="version-bom", option_var="current", value="current"),
+            "item = driver.find_element(By.ID, 'item')",
+            "item.send_keys('440000849200')"
         )
-        db.add(step11)
-        print("✓ Step 11: Apply BOM Filters")
-        
-        # ===================================================================
-        # STEP 12: Verify BOM Data and Complete Test
-        # ===================================================================
-        step12_json = json.dumps([
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "data-table",
-                "description": "Verify Produced Items table exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "btn-link",
-                "description": "Verify action links are present"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "consumed-items",
-                "description": "Verify consumed items section exists"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Final verification wait"
-            }
-        ], indent=2)
-        
-        step12 = TestStep(
-            test_case_id=tc.id,
-            step_number=12,
-            description="Verify BOM Data Display and Complete Test\n\nVerify that the Produced Items table displays correctly with item IDs, descriptions, locations, and action links. Confirm that the consumed items section is present and ready to display linked material data when action links are clicked. This completes the comprehensive workflow test.",
-            expected_result="Produced Items table displays with sample BOM data including items 440000849200 and 440000870300. Each row has a 'View Consumed' link in the Actions column. Consumed Items section is present below the table. All UI elements are properly rendered. Test completes successfully covering the full O9 workflow from login through forecast analysis to BOM setup.",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Python script for display only\ntable = driver.find_element(By.CLASS_NAME, 'data-table')\nassert table.is_displayed()\nlinks = driver.find_elements(By.CLASS_NAME, 'btn-link')\nassert len(links) > 0\ndriver.quit()",
-            selenium_script_json=step12_json
+    },
+    # STEP 12: Verify BOM Data and Complete Test
+    {
+        "name": "Verify BOM Data",
+        "description": "Verify BOM Data Display and Complete Test\n\nVerify that the Produced Items table displays correctly with item IDs, descriptions, locations, and action links. Confirm that the consumed items section is present and ready to display linked material data when action links are clicked. This completes the comprehensive workflow test.",
+        "expected_result": "Produced Items table displays with sample BOM data including items 440000849200 and 440000870300. Each row has a 'View Consumed' link in the Actions column. Consumed Items section is present below the table. All UI elements are properly rendered. Test completes successfully covering the full O9 workflow from login through forecast analysis to BOM setup.",
+        "selenium_script": _script(
+            SCRIPT_TEMPLATES["verify_displayed"].substitute(var="table", cls="data-table"),
+            "links = driver.find_elements(By.CLASS_NAME, 'btn-link')",
+            "assert len(links) > 0",
+            "driver.quit()"
         )
-        db.add(step12)
-        print("✓ Step 12: Verify BOM Data")
+    }
+]
+
+# Test case id resolved earlier in this process (created or already existing)
+_cached_test_case_id = None
+
+
+@lru_cache(maxsize=None)
+def _step_insert():
+    """Build the TestStep INSERT construct once and reuse it across calls"""
+    from sqlalchemy import insert
+    from app.models import TestStep
+    return insert(TestStep)
+
+
+def create_comprehensive_test(db=None):
+    """
+    Create a complete 12-step test case for O9 Platform
+    
+    Args:
+        db: Optional open session. When given, the test case is written inside
+            the caller's transaction and the caller commits and closes it;
+            errors are re-raised so the caller can roll back.
+    
+    Returns:
+        ID of the created (or already existing) test case, or None on failure
+    """
+    global _cached_test_case_id
+    owns_session = db is None
+    if owns_session and _cached_test_case_id is not None:
+        print(f"Test case already exists: ID {_cached_test_case_id}")
+        return _cached_test_case_id
+    
+    # Imported here so importing this module doesn't set up the database engine
+    from sqlalchemy import insert
+    from app.database import SessionLocal, init_db
+    from app.models import TestCase, TestCaseStatus, TestStepStatus, ExecutionStatus
+    
+    if owns_session:
+        init_db()
+        db = SessionLocal()
+    
+    try:
+        # One explicit transaction for the test case and all of its steps;
+        # it commits when the block exits and rolls back on any error
+        with db.begin() if owns_session else nullcontext():
+            # Check if test already exists
+            existing = db.query(TestCase).filter(
+                TestCase.name == TEST_CASE_NAME
+            ).first()
+            
+            if existing:
+                print(f"Test case already exists: ID {existing.id}")
+                print("Delete it first if you want to recreate it")
+                if owns_session:
+                    _cached_test_case_id = existing.id
+                return existing.id
+            
+            # Create test case - INSERT ... RETURNING gives us the id for the
+            # step foreign keys without a separate flush round-trip
+            tc_id = db.scalar(
+                insert(TestCase).returning(TestCase.id),
+                {
+                    "name": TEST_CASE_NAME,
+                    "description": "Comprehensive end-to-end test of O9 Platform including login, navigation, forecast generation, filter application, BOM setup, and data validation. This test covers 12 steps across all major modules.",
+                    "status": TestCaseStatus.APPROVED,
+                    "requirements": "Mock O9 website running on http://localhost:3001",
+                    "assigned_to": "Test Automation Team"
+                }
+            )
+            
+            print(f"\n{BAR}")
+            print(f"Creating comprehensive test case: {TEST_CASE_NAME}")
+            print(f"Test Case ID: {tc_id}")
+            print(f"{BAR}\n")
+            
+            # Steps are inserted as plain rows in one executemany; nothing
+            # reads them back, so ORM objects would only add overhead
+            step_rows = []
+            for number, step in enumerate(STEPS, 1):
+                step_rows.append({
+                    "test_case_id": tc_id,
+                    "step_number": number,
+                    "description": step["description"],
+                    "expected_result": step["expected_result"],
+                    "status": TestStepStatus.NOT_STARTED,
+                    "execution_status": ExecutionStatus.NOT_RUN,
+                    "selenium_script": step["selenium_script"],
+                    "selenium_script_json": STEP_SCRIPT_JSON[step["name"]]
+                })
+            
+            db.execute(_step_insert(), step_rows)
         
-        # Commit everything
-        db.commit()
+        print(f"✓ Inserted {len(STEPS)} steps for test case {tc_id}")
         
-        print(f"\n{'='*80}")
-        print(f"✓ SUCCESS! Created comprehensive test case with 12 steps")
-        print(f"{'='*80}")
-        print(f"Test Case ID: {tc.id}")
-        print(f"Test Case Name: {tc.name}")
-        print(f"Total Steps: 12")
-        print(f"{'='*80}")
-        print(f"\nTest Coverage:")
-        print(f"  ✓ Step 1-2:   Authentication and Dashboard Verification")
-        print(f"  ✓ Step 3-6:   Multi-level Menu Navigation (Demand Analyst)")
-        print(f"  ✓ Step 7-9:   Filter Application and Widget Verification")
-        print(f"  ✓ Step 10-12: Supply Planning Module and BOM Setup")
-        print(f"{'='*80}")
-        print(f"\nAccess the test at:")
-        print(f"  http://localhost:5173/test-case/{tc.id}")
-        print(f"{'='*80}\n")
+        # Emit the summary as one write instead of a print() per line
+        sys.stdout.write("\n".join([
+            f"\n{BAR}",
+            f"✓ SUCCESS! Created comprehensive test case with {len(STEPS)} steps",
+            BAR,
+            f"Test Case ID: {tc_id}",
+            f"Test Case Name: {TEST_CASE_NAME}",
+            f"Total Steps: {len(STEPS)}",
+            BAR,
+            "\nTest Coverage:",
+            "  ✓ Step 1-2:   Authentication and Dashboard Verification",
+            "  ✓ Step 3-6:   Multi-level Menu Navigation (Demand Analyst)",
+            "  ✓ Step 7-9:   Filter Application and Widget Verification",
+            "  ✓ Step 10-12: Supply Planning Module and BOM Setup",
+            BAR,
+            "\nAccess the test at:",
+            f"  http://localhost:5173/test-case/{tc_id}",
+            f"{BAR}\n",
+        ]) + "\n")
         
-        return tc.id
+        if owns_session:
+            _cached_test_case_id = tc_id
+        return tc_id
         
     except Exception as e:
-        db.rollback()
+        if not owns_session:
+            raise
         print(f"\n✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("create_comprehensive_test failed")
         return None
     finally:
-        db.close()
+        if owns_session:
+            db.close()
 
 
 if __name__ == "__main__":
-    print("\n" + "="*80)
+    print("\n" + BAR)
     print("CREATING COMPREHENSIVE O9 TEST CASE")
-    print("="*80 + "\n")
+    print(BAR + "\n")
     
     test_id = create_comprehensive_test()
     
     if test_id:
-        print("\n✓ Test case created successfully!")
-        print(f"\nNext steps:")
-        print(f"  1. Ensure Mock O9 is running: cd mock-o9-website && python -m http.server 3001")
-        print(f"  2. Ensure backend is running: cd backend && python run.py")
-        print(f"  3. Ensure frontend is running: cd frontend && npm run dev")
-        print(f"  4. Open: http://localhost:5173/test-case/{test_id}")
-        print(f"  5. Click 'Run Step' on each step and watch it work!")
-        print(f"\n" + "="*80)
+        print(textwrap.dedent(f"""
+            ✓ Test case created successfully!
+
+            Next steps:
+              1. Ensure Mock O9 is running: cd mock-o9-website && python -m http.server 3001
+              2. Ensure backend is running: cd backend && python run.py
+              3. Ensure frontend is running: cd frontend && npm run dev
+              4. Open: http://localhost:5173/test-case/{test_id}
+              5. Click 'Run Step' on each step and watch it work!
+
+            """) + BAR)
     else:
         print("\n✗ Failed to create test case")
         sys.exit(1)
@@ -5,1136 +5,466 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import insert
 from app.database import SessionLocal, init_db
 from app.models import TestCase, TestStep, TestStepStatus, ExecutionStatus, TestCaseStatus
 import json
+import logging
+import textwrap
 from datetime import datetime
+from itertools import chain
 
-def create_comprehensive_test_case():
+# orjson is optional; the stdlib encoder produces the same compact text
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(commands):
+    """
+    Encode a step's command list as compact JSON text. The frontend parses
+    selenium_script_json and pretty-prints it itself, so no indentation is stored.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(commands).decode()
+    return json.dumps(commands, separators=(",", ":"))
+
+
+MOCK_O9_URL = "http://localhost:3001"
+
+
+# Small builders for the executor's JSON commands
+def _click(locator_type, locator_value, description):
+    return {"action": "click", "locator_type": locator_type, "locator_value": locator_value, "description": description}
+
+
+def _click_css(selector, description):
+    return _click("css", selector, description)
+
+
+def _verify_present(locator_type, locator_value, description):
+    return {"action": "verify_element_present", "locator_type": locator_type, "locator_value": locator_value, "description": description}
+
+
+def _verify_all(description, *locators):
+    """
+    Check several elements in one runner round-trip. Each locator is a
+    (locator_type, locator_value) pair.
+    """
+    return {
+        "action": "verify_all",
+        "locators": [{"locator_type": locator_type, "locator_value": locator_value} for locator_type, locator_value in locators],
+        "description": description
+    }
+
+
+def _wait_for(locator_type, locator_value, description, expected_text=None):
+    """
+    Wait until an element is visible, or contains expected_text, rather than
+    sleeping a fixed time. The runner gives up after 10 seconds.
+    """
+    command = {"action": "wait_for_element", "locator_type": locator_type, "locator_value": locator_value, "description": description}
+    if expected_text:
+        command["expected_text"] = expected_text
+    return command
+
+
+def _wait_for_heading(text):
+    return _wait_for("tag", "h1", "Wait for page load", expected_text=text)
+
+
+def _select_option(select_id, value, label, option_text):
+    """Open a <select> by id and pick one of its options"""
+    return [
+        _click("id", select_id, f"Click {label} dropdown"),
+        _click_css(f"#{select_id} option[value='{value}']", f"Select {option_text}"),
+    ]
+
+
+# Sidebar menus (tagged with data-testid in the Mock O9 pages) and the submenu
+# links under them. Step lists reference these dicts rather than copies, so
+# treat them as read-only.
+CLICK_DEMAND_ANALYST = _click_css("a[data-testid='demand-analyst']", "Expand Demand Analyst")
+CLICK_SYSTEM_FORECAST = _click_css("a[onclick*='system-forecast']", "Click System Forecast")
+CLICK_GENERATE_FORECAST = _click_css("a[onclick*='generate-forecast']", "Click Generate Forecast")
+CLICK_FORECAST_DETAILS = _click_css("a[href='forecast.html']", "Click Details link")
+CLICK_FORECAST_ANALYSIS = _click_css("a[href='forecast-analysis.html']", "Click Forecast Analysis")
+CLICK_INVENTORY_PLANNING = _click_css("a[data-testid='inventory-planning']", "Expand Inventory Planning")
+CLICK_INVENTORY_MANAGEMENT = _click_css("a[href='inventory.html']", "Click Inventory Management")
+CLICK_SUPPLY_MASTER_PLANNING = _click_css("a[data-testid='supply-master-planning']", "Expand Supply Planning")
+CLICK_PRODUCTION_SCHEDULE = _click_css("a[href='supply-planning.html']", "Click Production Schedule")
+CLICK_MANAGE_NETWORK = _click_css("a[onclick*='manage-network']", "Click Manage Network")
+CLICK_MANUFACTURING_NETWORK = _click_css("a[onclick*='manufacturing-network']", "Click Manufacturing Network")
+CLICK_BOM_SETUP = _click_css("a[href='bom-setup.html']", "Click BOM Setup")
+
+
+def nav(*menu_clicks, page=None, prefix_id=None):
+    """
+    Commands that start from the dashboard after the auto-executed login and
+    click through menu_clicks in order. Submenus are hidden until their parent
+    is expanded, so each click first waits for its link to become visible.
+    If page is given, finish by waiting for that page's <h1> heading.
+    
+    prefix_id tags every command of the path; when running all steps in one
+    browser session, the executor skips a tagged path that the previous step
+    already completed while the browser is still on its page.
+    """
+    commands = []
+    for click in menu_clicks:
+        commands += [_wait_for(click["locator_type"], click["locator_value"], "Wait for menu link"), click]
+    if page:
+        commands.append(_wait_for_heading(page))
+    return _tag_prefix(commands, prefix_id)
+
+
+def goto(page_file, page, prefix_id=None):
+    """
+    Commands that open a Mock O9 page directly by URL and wait for its <h1>
+    heading, for steps that check a page rather than the menus leading to
+    it. The pages keep the login in sessionStorage, so this relies on the
+    auto-executed login having run in the same browser tab.
+    """
+    commands = [
+        {"action": "navigate", "url": f"{MOCK_O9_URL}/{page_file}", "description": f"Open {page_file}"},
+        _wait_for_heading(page),
+    ]
+    return _tag_prefix(commands, prefix_id)
+
+
+def _tag_prefix(commands, prefix_id):
+    """Copy commands with prefix_id set, so the runner can skip a path it just ran"""
+    if prefix_id:
+        commands = [{**command, "prefix_id": prefix_id} for command in commands]
+    return commands
+
+
+def compose(*fragments):
+    """
+    A step's full command list: its fragments (a nav() or goto() path, then
+    the step's own actions) joined in order. The command dicts are shared,
+    not copied.
+    """
+    return list(chain.from_iterable(fragments))
+
+
+# Menu paths to each Mock O9 page, for the steps that test navigating there
+FORECAST_NAV = nav(
+    CLICK_DEMAND_ANALYST, CLICK_SYSTEM_FORECAST, CLICK_GENERATE_FORECAST, CLICK_FORECAST_DETAILS,
+    page="Generate Forecast", prefix_id="forecast"
+)
+FORECAST_ANALYSIS_NAV = nav(
+    CLICK_DEMAND_ANALYST, CLICK_FORECAST_ANALYSIS,
+    page="Forecast Analysis - Advanced View", prefix_id="forecast_analysis"
+)
+INVENTORY_NAV = nav(
+    CLICK_INVENTORY_PLANNING, CLICK_INVENTORY_MANAGEMENT,
+    page="Inventory Management", prefix_id="inventory"
+)
+SUPPLY_PLANNING_NAV = nav(
+    CLICK_SUPPLY_MASTER_PLANNING, CLICK_PRODUCTION_SCHEDULE,
+    page="Supply Planning - Production Schedule", prefix_id="supply"
+)
+BOM_SETUP_NAV = nav(
+    CLICK_SUPPLY_MASTER_PLANNING, CLICK_MANAGE_NETWORK, CLICK_MANUFACTURING_NETWORK, CLICK_BOM_SETUP,
+    page="BOM Setup", prefix_id="bom"
+)
+
+# Direct URL paths for steps that only check a page's content. Each shares
+# its prefix_id with the menu path above, since both end on the same page.
+FORECAST_PAGE = goto("forecast.html", "Generate Forecast", prefix_id="forecast")
+FORECAST_ANALYSIS_PAGE = goto("forecast-analysis.html", "Forecast Analysis - Advanced View", prefix_id="forecast_analysis")
+INVENTORY_PAGE = goto("inventory.html", "Inventory Management", prefix_id="inventory")
+SUPPLY_PLANNING_PAGE = goto("supply-planning.html", "Supply Planning - Production Schedule", prefix_id="supply")
+BOM_SETUP_PAGE = goto("bom-setup.html", "BOM Setup", prefix_id="bom")
+
+LOGIN_COMMANDS = [
+    {"action": "navigate", "url": MOCK_O9_URL, "description": "Navigate to Mock O9 login page"},
+    _verify_present("id", "username", "Verify username field exists"),
+    _verify_present("id", "password", "Verify password field exists"),
+    {"action": "input", "locator_type": "id", "locator_value": "username", "text": "testuser", "description": "Enter username"},
+    {"action": "input", "locator_type": "id", "locator_value": "password", "text": "password123", "description": "Enter password"},
+    _click("id", "login-button", "Click login button"),
+    _wait_for_heading("Welcome to O9 Platform"),
+]
+
+
+# The 17 steps in execution order. "name" is only used for progress output.
+STEPS = [
+    # STEP 1: Login (Foundation for auto-login)
+    {
+        "name": "Login",
+        "description": "Login to Mock O9 Platform\n\nNavigate to http://localhost:3001 and authenticate with testuser/password123. This step is automatically executed before all other steps.",
+        "expected_result": "User successfully logs in and sees dashboard with 'Welcome to O9 Platform' heading",
+        "selenium_script": "# Login to Mock O9\n# This step is auto-executed before all other steps",
+        "commands": LOGIN_COMMANDS
+    },
+    # STEP 2: Verify Dashboard Widgets
+    {
+        "name": "Verify Dashboard",
+        "description": "Verify Dashboard Loads with Widgets\n\nAfter login (auto-executed), verify dashboard displays with widgets and sidebar.",
+        "expected_result": "Dashboard displays with widgets container, sidebar, and at least one widget visible",
+        "selenium_script": "# Verify dashboard widgets",
+        "commands": [
+            _verify_present("class", "dashboard-widgets", "Verify widgets container"),
+            _verify_present("class", "sidebar", "Verify sidebar present"),
+            _verify_present("class", "widget", "Verify at least one widget"),
+        ]
+    },
+    # STEP 3: Expand Demand Analyst Menu
+    {
+        "name": "Expand Demand Analyst",
+        "description": "Expand Demand Analyst Menu\n\nAfter login, expand the Demand Analyst menu to reveal submenu options.",
+        "expected_result": "Demand Analyst submenu expands and shows System Forecast and other options",
+        "selenium_script": "# Expand Demand Analyst",
+        "commands": compose(nav({**CLICK_DEMAND_ANALYST, "description": "Click Demand Analyst menu"}), [
+            _wait_for("id", "demand-analyst", "Verify menu expanded"),
+        ])
+    },
+    # STEP 4: Navigate to Forecast Page
+    {
+        "name": "Navigate to Forecast",
+        "description": "Navigate to System Forecast Page\n\nAfter login, navigate through menu: Demand Analyst → System Forecast → Generate Forecast → Details.",
+        "expected_result": "System Forecast page loads with 'Generate Forecast' heading and filters",
+        "selenium_script": "# Navigate to forecast",
+        "commands": FORECAST_NAV
+    },
+    # STEP 5: Verify Forecast Filters
+    {
+        "name": "Verify Forecast Filters",
+        "description": "Verify Forecast Page Filters Display\n\nAfter login, navigate to forecast page and verify filters are present.",
+        "expected_result": "Forecast iteration and region filters are visible on the page",
+        "selenium_script": "# Verify filters",
+        "commands": compose(FORECAST_PAGE, [
+            _verify_present("id", "forecast-iteration", "Verify forecast iteration filter"),
+            _verify_present("id", "region", "Verify region filter"),
+        ])
+    },
+    # STEP 6: Navigate to Forecast Analysis
+    {
+        "name": "Navigate to Forecast Analysis",
+        "description": "Navigate to Forecast Analysis Page\n\nAfter login, navigate: Demand Analyst → Forecast Analysis.",
+        "expected_result": "Forecast Analysis page loads with 'Forecast Analysis - Advanced View' heading",
+        "selenium_script": "# Navigate to forecast analysis",
+        "commands": FORECAST_ANALYSIS_NAV
+    },
+    # STEP 7: Verify KPI Cards
+    {
+        "name": "Verify KPI Cards",
+        "description": "Verify KPI Cards on Forecast Analysis\n\nAfter login, navigate to Forecast Analysis and verify all KPI cards display.",
+        "expected_result": "All four KPI cards are visible: Forecast Accuracy, Bias, MAPE, and Total Volume",
+        "selenium_script": "# Verify KPIs",
+        "commands": compose(FORECAST_ANALYSIS_PAGE, [
+            _verify_present("id", "forecast-accuracy", "Verify Forecast Accuracy KPI"),
+            _verify_present("id", "bias", "Verify Bias KPI"),
+            _verify_present("id", "mape", "Verify MAPE KPI"),
+            _verify_present("id", "total-volume", "Verify Total Volume KPI"),
+        ])
+    },
+    # STEP 8: Test Time Period Filter
+    {
+        "name": "Test Time Period Filter",
+        "description": "Change Time Period Filter on Forecast Analysis\n\nAfter login, navigate to Forecast Analysis and change time period to 'Last Quarter'.",
+        "expected_result": "Time period filter changes to 'Last Quarter'",
+        "selenium_script": "# Test time filter",
+        "commands": compose(FORECAST_ANALYSIS_PAGE, _select_option("time-period", "last-quarter", "time period", "Last Quarter"))
+    },
+    # STEP 9: Navigate to Inventory Management
+    {
+        "name": "Navigate to Inventory",
+        "description": "Navigate to Inventory Management Page\n\nAfter login, navigate: Inventory Planning → Inventory Management.",
+        "expected_result": "Inventory Management page loads with 'Inventory Management' heading",
+        "selenium_script": "# Navigate to inventory",
+        "commands": INVENTORY_NAV
+    },
+    # STEP 10: Verify Inventory KPIs
+    {
+        "name": "Verify Inventory KPIs",
+        "description": "Verify Inventory KPI Cards Display\n\nAfter login, navigate to Inventory Management and verify KPI cards display.",
+        "expected_result": "KPI cards show Total Items, Total Value, Low Stock Alerts, and Out of Stock",
+        "selenium_script": "# Verify inventory KPIs",
+        "commands": compose(INVENTORY_PAGE, [
+            _verify_present("class", "kpi-cards", "Verify KPI cards container"),
+            _verify_present("xpath", "//h3[text()='Total Items']", "Verify Total Items KPI"),
+            _verify_present("xpath", "//h3[text()='Low Stock Alerts']", "Verify Low Stock KPI"),
+        ])
+    },
+    # STEP 11: Filter by Warehouse
+    {
+        "name": "Filter by Warehouse",
+        "description": "Filter Inventory by Warehouse\n\nAfter login, navigate to Inventory Management and filter by Warehouse 003.",
+        "expected_result": "Warehouse filter set to 'Warehouse 003 - Chicago'",
+        "selenium_script": "# Filter by warehouse",
+        "commands": compose(INVENTORY_PAGE, _select_option("warehouse", "WH-003", "warehouse", "Warehouse 003"))
+    },
+    # STEP 12: Verify Status Badges
+    {
+        "name": "Verify Status Badges",
+        "description": "Verify Inventory Status Badges Display\n\nAfter login, navigate to Inventory Management and verify status badges display with different colors.",
+        "expected_result": "Status badges show with different colors: green (In Stock), yellow (Low Stock), red (Out of Stock)",
+        "selenium_script": "# Verify badges",
+        "commands": compose(INVENTORY_PAGE, [
+            _verify_present("class", "status-success", "Verify In Stock badge"),
+            _verify_present("class", "status-warning", "Verify Low Stock badge"),
+            _verify_present("class", "status-danger", "Verify Out of Stock badge"),
+        ])
+    },
+    # STEP 13: Navigate to Supply Planning
+    {
+        "name": "Navigate to Supply Planning",
+        "description": "Navigate to Supply Planning Page\n\nAfter login, navigate: Supply Master Planning → Production Schedule.",
+        "expected_result": "Supply Planning page loads with 'Supply Planning - Production Schedule' heading",
+        "selenium_script": "# Navigate to supply planning",
+        "commands": SUPPLY_PLANNING_NAV
+    },
+    # STEP 14: Verify Production Schedule
+    {
+        "name": "Verify Production Schedule",
+        "description": "Verify Production Schedule Table\n\nAfter login, navigate to Supply Planning and verify production schedule table displays.",
+        "expected_result": "Production schedule table displays with orders (PO-1001, etc.) and status badges",
+        "selenium_script": "# Verify schedule",
+        "commands": compose(SUPPLY_PLANNING_PAGE, [
+            _verify_all(
+                "Verify schedule table, order PO-1001 and On Track status",
+                ("id", "production-schedule"),
+                ("css", "tr[data-order-id='PO-1001']"),
+                ("class", "status-success"),
+            ),
+        ])
+    },
+    # STEP 15: Test Planning Horizon Filter
+    {
+        "name": "Test Planning Horizon",
+        "description": "Change Planning Horizon Filter\n\nAfter login, navigate to Supply Planning and change planning horizon to '3 Months'.",
+        "expected_result": "Planning horizon filter changes to '3 Months'",
+        "selenium_script": "# Test planning filter",
+        "commands": compose(SUPPLY_PLANNING_PAGE, _select_option("planning-horizon", "3-months", "planning horizon", "3 Months"))
+    },
+    # STEP 16: Navigate to BOM Setup
+    {
+        "name": "Navigate to BOM Setup",
+        "description": "Navigate to BOM Setup Page\n\nAfter login, navigate: Supply Master Planning → Manage Network → Manufacturing Network → BOM Setup.",
+        "expected_result": "BOM Setup page loads with 'BOM Setup' heading",
+        "selenium_script": "# Navigate to BOM",
+        "commands": BOM_SETUP_NAV
+    },
+    # STEP 17: Verify BOM Table
+    {
+        "name": "Verify BOM Table",
+        "description": "Verify BOM Table Display\n\nAfter login, navigate to BOM Setup and verify BOM table displays with data.",
+        "expected_result": "BOM table displays with headers and component data",
+        "selenium_script": "# Verify BOM table",
+        "commands": compose(BOM_SETUP_PAGE, [
+            _verify_all(
+                "Verify BOM table and headers",
+                ("class", "data-table"),
+                ("xpath", "//th[text()='Item ID']"),
+            ),
+        ])
+    },
+]
+
+# selenium_script_json for each step, in STEPS order. The commands never depend
+# on the database, so they are serialized once at import instead of per call.
+STEP_SCRIPT_JSON = [_dumps(step["commands"]) for step in STEPS]
+
+
+def create_comprehensive_test_case(verbose=False):
+    """
+    Create the test case and its steps, returning the new test case ID (None
+    on failure). The feature summary is only logged when verbose is set.
+    """
     init_db()
-    db = SessionLocal()
     
     try:
         print(f"\n{'='*80}")
         print(f"CREATING COMPREHENSIVE MOCK O9 TEST CASE")
         print(f"{'='*80}\n")
         
-        # Create test case
-        tc = TestCase(
-            name="Mock O9 - Complete Feature Test Suite",
-            description="Comprehensive test covering all Mock O9 features: Dashboard, Demand Analysis, Forecast Analysis, Inventory Management, Supply Planning, and BOM Setup. Auto-login is built-in.",
-            status=TestCaseStatus.APPROVED,
-            requirements="Mock O9 running on http://localhost:3001. Backend auto-executes Step 1 (login) before all other steps.",
-            assigned_to="Test Automation Team"
-        )
-        
-        db.add(tc)
-        db.flush()  # Get the ID
-        
-        print(f"✓ Created test case: {tc.name}")
-        print(f"  ID: {tc.id}")
-        print(f"\nAdding test steps...\n")
-        
-        steps = []
-        
-        # ================================================================
-        # STEP 1: Login (Foundation for auto-login)
-        # ================================================================
-        login_json = json.dumps([
-            {
-                "action": "navigate",
-                "url": "http://localhost:3001",
-                "description": "Navigate to Mock O9 login page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "username",
-                "description": "Verify username field exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "password",
-                "description": "Verify password field exists"
-            },
-            {
-                "action": "input",
-                "locator_type": "id",
-                "locator_value": "username",
-                "text": "testuser",
-                "description": "Enter username"
-            },
-            {
-                "action": "input",
-                "locator_type": "id",
-                "locator_value": "password",
-                "text": "password123",
-                "description": "Enter password"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "login-button",
-                "description": "Click login button"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for login to complete"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Welcome to O9 Platform",
-                "description": "Verify dashboard loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=1,
-            description="Login to Mock O9 Platform\n\nNavigate to http://localhost:3001 and authenticate with testuser/password123. This step is automatically executed before all other steps.",
-            expected_result="User successfully logs in and sees dashboard with 'Welcome to O9 Platform' heading",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Login to Mock O9\n# This step is auto-executed before all other steps",
-            selenium_script_json=login_json
-        ))
-        print("✓ Step 1: Login")
-        
-        # ================================================================
-        # STEP 2: Verify Dashboard Widgets
-        # ================================================================
-        dashboard_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "dashboard-widgets",
-                "description": "Verify widgets container"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "sidebar",
-                "description": "Verify sidebar present"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "widget",
-                "description": "Verify at least one widget"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=2,
-            description="Verify Dashboard Loads with Widgets\n\nAfter login (auto-executed), verify dashboard displays with widgets and sidebar.",
-            expected_result="Dashboard displays with widgets container, sidebar, and at least one widget visible",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify dashboard widgets",
-            selenium_script_json=dashboard_json
-        ))
-        print("✓ Step 2: Verify Dashboard")
-        
-        # ================================================================
-        # STEP 3: Expand Demand Analyst Menu
-        # ================================================================
-        demand_analyst_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Click Demand Analyst menu"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "demand-analyst",
-                "description": "Verify menu expanded"
+        # Test case and steps share one transaction: it commits when the
+        # block exits and rolls back if anything inside raises
+        with SessionLocal.begin() as db:
+            # Create test case
+            tc = TestCase(
+                name="Mock O9 - Complete Feature Test Suite",
+                description="Comprehensive test covering all Mock O9 features: Dashboard, Demand Analysis, Forecast Analysis, Inventory Management, Supply Planning, and BOM Setup. Auto-login is built-in.",
+                status=TestCaseStatus.APPROVED,
+                requirements="Mock O9 running on http://localhost:3001. Backend auto-executes Step 1 (login) before all other steps.",
+                assigned_to="Test Automation Team"
+            )
+            
+            db.add(tc)
+            db.flush()  # Get the ID
+            tc_id, tc_name = tc.id, tc.name
+            
+            print(f"✓ Created test case: {tc.name}")
+            print(f"  ID: {tc.id}")
+            print(f"\nAdding test steps...\n")
+            
+            # Columns that are the same for every step row
+            base = {
+                "test_case_id": tc.id,
+                "status": TestStepStatus.NOT_STARTED,
+                "execution_status": ExecutionStatus.NOT_RUN,
             }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=3,
-            description="Expand Demand Analyst Menu\n\nAfter login, expand the Demand Analyst menu to reveal submenu options.",
-            expected_result="Demand Analyst submenu expands and shows System Forecast and other options",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Expand Demand Analyst",
-            selenium_script_json=demand_analyst_json
-        ))
-        print("✓ Step 3: Expand Demand Analyst")
-        
-        # ================================================================
-        # STEP 4: Navigate to Forecast Page
-        # ================================================================
-        forecast_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Expand Demand Analyst"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'system-forecast')]",
-                "description": "Click System Forecast"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'generate-forecast')]",
-                "description": "Click Generate Forecast"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='forecast.html']",
-                "description": "Click Details link"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Generate Forecast",
-                "description": "Verify forecast page loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=4,
-            description="Navigate to System Forecast Page\n\nAfter login, navigate through menu: Demand Analyst → System Forecast → Generate Forecast → Details.",
-            expected_result="System Forecast page loads with 'Generate Forecast' heading and filters",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to forecast",
-            selenium_script_json=forecast_json
-        ))
-        print("✓ Step 4: Navigate to Forecast")
-        
-        # ================================================================
-        # STEP 5: Verify Forecast Filters
-        # ================================================================
-        forecast_filters_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Navigate to page"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'system-forecast')]",
-                "description": "System Forecast"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'generate-forecast')]",
-                "description": "Generate Forecast"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='forecast.html']",
-                "description": "Details"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "forecast-iteration",
-                "description": "Verify forecast iteration filter"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "region",
-                "description": "Verify region filter"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=5,
-            description="Verify Forecast Page Filters Display\n\nAfter login, navigate to forecast page and verify filters are present.",
-            expected_result="Forecast iteration and region filters are visible on the page",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify filters",
-            selenium_script_json=forecast_filters_json
-        ))
-        print("✓ Step 5: Verify Forecast Filters")
-        
-        # ================================================================
-        # STEP 6: Navigate to Forecast Analysis
-        # ================================================================
-        forecast_analysis_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Expand Demand Analyst"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='forecast-analysis.html']",
-                "description": "Click Forecast Analysis"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Forecast Analysis - Advanced View",
-                "description": "Verify page loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=6,
-            description="Navigate to Forecast Analysis Page\n\nAfter login, navigate: Demand Analyst → Forecast Analysis.",
-            expected_result="Forecast Analysis page loads with 'Forecast Analysis - Advanced View' heading",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to forecast analysis",
-            selenium_script_json=forecast_analysis_json
-        ))
-        print("✓ Step 6: Navigate to Forecast Analysis")
-        
-        # ================================================================
-        # STEP 7: Verify KPI Cards on Forecast Analysis
-        # ================================================================
-        kpi_cards_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='forecast-analysis.html']",
-                "description": "Go to analysis"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "forecast-accuracy",
-                "description": "Verify Forecast Accuracy KPI"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "bias",
-                "description": "Verify Bias KPI"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "mape",
-                "description": "Verify MAPE KPI"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "total-volume",
-                "description": "Verify Total Volume KPI"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=7,
-            description="Verify KPI Cards on Forecast Analysis\n\nAfter login, navigate to Forecast Analysis and verify all KPI cards display.",
-            expected_result="All four KPI cards are visible: Forecast Accuracy, Bias, MAPE, and Total Volume",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify KPIs",
-            selenium_script_json=kpi_cards_json
-        ))
-        print("✓ Step 7: Verify KPI Cards")
-        
-        # ================================================================
-        # STEP 8: Test Time Period Filter on Forecast Analysis
-        # ================================================================
-        time_period_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='forecast-analysis.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "time-period",
-                "description": "Click time period dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='time-period']/option[@value='last-quarter']",
-                "description": "Select Last Quarter"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after selection"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=8,
-            description="Change Time Period Filter on Forecast Analysis\n\nAfter login, navigate to Forecast Analysis and change time period to 'Last Quarter'.",
-            expected_result="Time period filter changes to 'Last Quarter'",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Test time filter",
-            selenium_script_json=time_period_json
-        ))
-        print("✓ Step 8: Test Time Period Filter")
-        
-        # ================================================================
-        # STEP 9: Navigate to Inventory Management
-        # ================================================================
-        inventory_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Inventory Planning']/parent::a",
-                "description": "Expand Inventory Planning"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='inventory.html']",
-                "description": "Click Inventory Management"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Inventory Management",
-                "description": "Verify page loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=9,
-            description="Navigate to Inventory Management Page\n\nAfter login, navigate: Inventory Planning → Inventory Management.",
-            expected_result="Inventory Management page loads with 'Inventory Management' heading",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to inventory",
-            selenium_script_json=inventory_json
-        ))
-        print("✓ Step 9: Navigate to Inventory")
-        
-        # ================================================================
-        # STEP 10: Verify Inventory KPI Cards
-        # ================================================================
-        inventory_kpis_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Inventory Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='inventory.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "kpi-cards",
-                "description": "Verify KPI cards container"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "xpath",
-                "locator_value": "//h3[text()='Total Items']",
-                "description": "Verify Total Items KPI"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "xpath",
-                "locator_value": "//h3[text()='Low Stock Alerts']",
-                "description": "Verify Low Stock KPI"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=10,
-            description="Verify Inventory KPI Cards Display\n\nAfter login, navigate to Inventory Management and verify KPI cards display.",
-            expected_result="KPI cards show Total Items, Total Value, Low Stock Alerts, and Out of Stock",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify inventory KPIs",
-            selenium_script_json=inventory_kpis_json
-        ))
-        print("✓ Step 10: Verify Inventory KPIs")
-        
-        # ================================================================
-        # STEP 11: Filter Inventory by Warehouse
-        # ================================================================
-        filter_warehouse_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Inventory Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='inventory.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "warehouse",
-                "description": "Click warehouse dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='warehouse']/option[@value='WH-003']",
-                "description": "Select Warehouse 003"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after selection"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=11,
-            description="Filter Inventory by Warehouse\n\nAfter login, navigate to Inventory Management and filter by Warehouse 003.",
-            expected_result="Warehouse filter set to 'Warehouse 003 - Chicago'",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Filter by warehouse",
-            selenium_script_json=filter_warehouse_json
-        ))
-        print("✓ Step 11: Filter by Warehouse")
-        
-        # ================================================================
-        # STEP 12: Verify Inventory Status Badges
-        # ================================================================
-        status_badges_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Inventory Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='inventory.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "status-success",
-                "description": "Verify In Stock badge"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "status-warning",
-                "description": "Verify Low Stock badge"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "status-danger",
-                "description": "Verify Out of Stock badge"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=12,
-            description="Verify Inventory Status Badges Display\n\nAfter login, navigate to Inventory Management and verify status badges display with different colors.",
-            expected_result="Status badges show with different colors: green (In Stock), yellow (Low Stock), red (Out of Stock)",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify badges",
-            selenium_script_json=status_badges_json
-        ))
-        print("✓ Step 12: Verify Status Badges")
-        
-        # ================================================================
-        # STEP 13: Navigate to Supply Planning
-        # ================================================================
-        supply_planning_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Supply Master Planning']/parent::a",
-                "description": "Expand Supply Planning"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait for submenu"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='supply-planning.html']",
-                "description": "Click Production Schedule"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "Supply Planning - Production Schedule",
-                "description": "Verify page loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=13,
-            description="Navigate to Supply Planning Page\n\nAfter login, navigate: Supply Master Planning → Production Schedule.",
-            expected_result="Supply Planning page loads with 'Supply Planning - Production Schedule' heading",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to supply planning",
-            selenium_script_json=supply_planning_json
-        ))
-        print("✓ Step 13: Navigate to Supply Planning")
-        
-        # ================================================================
-        # STEP 14: Verify Production Schedule Table
-        # ================================================================
-        production_schedule_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Supply Master Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='supply-planning.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "production-schedule",
-                "description": "Verify schedule table exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "xpath",
-                "locator_value": "//td[text()='PO-1001']",
-                "description": "Verify order PO-1001"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "status-success",
-                "description": "Verify On Track status"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=14,
-            description="Verify Production Schedule Table\n\nAfter login, navigate to Supply Planning and verify production schedule table displays.",
-            expected_result="Production schedule table displays with orders (PO-1001, etc.) and status badges",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify schedule",
-            selenium_script_json=production_schedule_json
-        ))
-        print("✓ Step 14: Verify Production Schedule")
-        
-        # ================================================================
-        # STEP 15: Test Planning Horizon Filter
-        # ================================================================
-        planning_horizon_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Supply Master Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='supply-planning.html']",
-                "description": "Go to page"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "id",
-                "locator_value": "planning-horizon",
-                "description": "Click planning horizon dropdown"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//select[@id='planning-horizon']/option[@value='3-months']",
-                "description": "Select 3 Months"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after selection"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=15,
-            description="Change Planning Horizon Filter\n\nAfter login, navigate to Supply Planning and change planning horizon to '3 Months'.",
-            expected_result="Planning horizon filter changes to '3 Months'",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Test planning filter",
-            selenium_script_json=planning_horizon_json
-        ))
-        print("✓ Step 15: Test Planning Horizon")
-        
-        # ================================================================
-        # STEP 16: Navigate to BOM Setup
-        # ================================================================
-        bom_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Supply Master Planning']/parent::a",
-                "description": "Expand Supply Planning"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'manage-network')]",
-                "description": "Click Manage Network"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'manufacturing-network')]",
-                "description": "Click Manufacturing Network"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='bom-setup.html']",
-                "description": "Click BOM Setup"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait for page load"
-            },
-            {
-                "action": "verify_text",
-                "locator_type": "tag",
-                "locator_value": "h1",
-                "expected_text": "BOM Setup",
-                "description": "Verify page loaded"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=16,
-            description="Navigate to BOM Setup Page\n\nAfter login, navigate: Supply Master Planning → Manage Network → Manufacturing Network → BOM Setup.",
-            expected_result="BOM Setup page loads with 'BOM Setup' heading",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to BOM",
-            selenium_script_json=bom_json
-        ))
-        print("✓ Step 16: Navigate to BOM Setup")
-        
-        # ================================================================
-        # STEP 17: Verify BOM Table
-        # ================================================================
-        bom_table_json = json.dumps([
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait after login"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Supply Master Planning']/parent::a",
-                "description": "Navigate"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'manage-network')]",
-                "description": "Manage Network"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'manufacturing-network')]",
-                "description": "Manufacturing"
-            },
-            {
-                "action": "wait",
-                "duration": 1,
-                "description": "Wait"
-            },
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[@href='bom-setup.html']",
-                "description": "BOM Setup"
-            },
-            {
-                "action": "wait",
-                "duration": 2,
-                "description": "Wait"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "class",
-                "locator_value": "data-table",
-                "description": "Verify BOM table exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "xpath",
-                "locator_value": "//th[text()='Item']",
-                "description": "Verify table headers"
-            }
-        ], indent=2)
-        
-        steps.append(TestStep(
-            test_case_id=tc.id,
-            step_number=17,
-            description="Verify BOM Table Display\n\nAfter login, navigate to BOM Setup and verify BOM table displays with data.",
-            expected_result="BOM table displays with headers and component data",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify BOM table",
-            selenium_script_json=bom_table_json
-        ))
-        print("✓ Step 17: Verify BOM Table")
-        
-        # Add all steps to database
-        for step in steps:
-            db.add(step)
-        
-        db.commit()
-        
-        print(f"\n{'='*80}")
-        print(f"✓ SUCCESSFULLY CREATED {len(steps)} TEST STEPS")
-        print(f"{'='*80}")
-        print(f"\nTest Case Summary:")
-        print(f"  ID: {tc.id}")
-        print(f"  Name: {tc.name}")
-        print(f"  Total Steps: {len(steps)}")
-        print(f"\nFeatures Covered:")
-        print(f"  • Basic: Login, Dashboard verification")
-        print(f"  • Demand Analysis: Menu navigation, Forecast pages")
-        print(f"  • Forecast Analysis: KPIs, charts, filters")
-        print(f"  • Inventory: KPIs, filters, status badges")
-        print(f"  • Supply Planning: Production schedule, filters")
-        print(f"  • BOM Setup: Table verification")
-        print(f"\nKey Features:")
-        print(f"  ✓ All steps use JSON-only format")
-        print(f"  ✓ Auto-login built-in (Step 1)")
-        print(f"  ✓ Correct XPath selectors")
-        print(f"  ✓ Complete navigation paths")
-        print(f"{'='*80}")
-        print(f"\nAccess: http://localhost:5173/test-case/{tc.id}")
-        print(f"{'='*80}\n")
-        
-        return tc.id
-        
-    except Exception as e:
-        db.rollback()
-        print(f"\n✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+            
+            steps = []
+            progress = []
+            for step_number, (step, script_json) in enumerate(zip(STEPS, STEP_SCRIPT_JSON), 1):
+                steps.append({
+                    **base,
+                    "step_number": step_number,
+                    "description": step["description"],
+                    "expected_result": step["expected_result"],
+                    "selenium_script": step["selenium_script"],
+                    "selenium_script_json": script_json
+                })
+                progress.append(f"✓ Step {step_number}: {step['name']}")
+            
+            # Add all steps to database in one executemany INSERT
+            db.execute(insert(TestStep), steps)
+        
+        # Step progress goes out in one write once the steps are committed
+        sys.stdout.write("\n".join(progress) + "\n")
+        
+        print(f"\n✓ SUCCESSFULLY CREATED {len(steps)} TEST STEPS", flush=True)
+        
+        if verbose:
+            logger.info(textwrap.dedent(f"""
+                {'='*80}
+                Test Case Summary:
+                  ID: {tc_id}
+                  Name: {tc_name}
+                  Total Steps: {len(steps)}
+                
+                Features Covered:
+                  • Basic: Login, Dashboard verification
+                  • Demand Analysis: Menu navigation, Forecast pages
+                  • Forecast Analysis: KPIs, charts, filters
+                  • Inventory: KPIs, filters, status badges
+                  • Supply Planning: Production schedule, filters
+                  • BOM Setup: Table verification
+                
+                Key Features:
+                  ✓ All steps use JSON-only format
+                  ✓ Auto-login built-in (Step 1)
+                  ✓ Stable CSS and XPath selectors
+                  ✓ Complete navigation paths
+                {'='*80}
+                
+                Access: http://localhost:5173/test-case/{tc_id}
+                {'='*80}
+            """))
+        
+        return tc_id
+        
+    except Exception:
+        logger.exception("Failed to create comprehensive test case")
         return None
-    finally:
-        db.close()
 
 if __name__ == "__main__":
-    create_comprehensive_test_case()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    create_comprehensive_test_case(verbose=True)
@@ -5,427 +5,332 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from sqlalchemy import insert
 from app.database import SessionLocal, init_db
 from app.models import TestCase, TestStep, TestCaseStatus, TestStepStatus, ExecutionStatus
 import json
 
+# orjson is optional; the stdlib encoder produces the same compact text
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(commands):
+    """
+    Encode a step's command list as compact JSON text. The frontend parses
+    selenium_script_json and pretty-prints it itself, so no indentation is stored.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(commands).decode()
+    return json.dumps(commands, separators=(",", ":"))
+
+
+# Small builders for the executor's JSON commands
+def _wait(duration, description):
+    return {"action": "wait", "duration": duration, "description": description}
+
+
+def _click(locator_type, locator_value, description):
+    return {"action": "click", "locator_type": locator_type, "locator_value": locator_value, "description": description}
+
+
+def _input(locator_type, locator_value, text, description):
+    return {"action": "input", "locator_type": locator_type, "locator_value": locator_value, "text": text, "description": description}
+
+
+def _verify_present(locator_type, locator_value, description):
+    return {"action": "verify_element_present", "locator_type": locator_type, "locator_value": locator_value, "description": description}
+
+
+def _verify_text(locator_type, locator_value, expected_text, description):
+    return {"action": "verify_text", "locator_type": locator_type, "locator_value": locator_value, "expected_text": expected_text, "description": description}
+
+
+# XPath locators for the sidebar menu links, shared by the paths and steps below
+XP_DEMAND_ANALYST = "//span[text()='Demand Analyst']/parent::a"
+XP_SYSTEM_FORECAST = "//a[contains(@onclick, 'system-forecast')]"
+XP_GENERATE_FORECAST = "//a[contains(@onclick, 'generate-forecast')]"
+XP_FORECAST_DETAILS = "//a[@href='forecast.html']"
+XP_SUPPLY_MASTER_PLANNING = "//span[text()='Supply Master Planning']/parent::a"
+XP_MANAGE_NETWORK = "//a[contains(@onclick, 'manage-network')]"
+XP_MANUFACTURING_NETWORK = "//a[contains(@onclick, 'manufacturing-network')]"
+XP_BOM_SETUP = "//a[@href='bom-setup.html']"
+
+# Menu paths from the dashboard, shared by every step on the page they reach.
+# Submenus only open after their parent is clicked, hence the short waits.
+NAV_FORECAST = [
+    _wait(1, "Wait"),
+    _click("xpath", XP_DEMAND_ANALYST, "Expand Demand Analyst"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_SYSTEM_FORECAST, "Expand System Forecast"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_GENERATE_FORECAST, "Expand Generate Forecast"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_FORECAST_DETAILS, "Click Details link"),
+    _wait(2, "Wait for page load")
+]
+
+NAV_BOM = [
+    _wait(1, "Wait"),
+    _click("xpath", XP_SUPPLY_MASTER_PLANNING, "Expand Supply Planning"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_MANAGE_NETWORK, "Expand Manage Network"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_MANUFACTURING_NETWORK, "Expand Manufacturing Network"),
+    _wait(1, "Wait"),
+    _click("xpath", XP_BOM_SETUP, "Click BOM Setup"),
+    _wait(2, "Wait for page load")
+]
+
+# The paths are encoded once; steps append their own commands to the text
+NAV_FORECAST_JSON = _dumps(NAV_FORECAST)
+NAV_BOM_JSON = _dumps(NAV_BOM)
+
+
+def _dumps_after(prefix_json, commands):
+    """
+    Encode a non-empty command list onto the end of an already encoded one,
+    giving the same text as _dumps(prefix + commands)
+    """
+    return prefix_json[:-1] + "," + _dumps(commands)[1:]
+
+
+# The 12 steps in execution order. "name" is only used for progress output.
+# script_json is encoded here, once per process, rather than on every call.
+STEPS = [
+    # STEP 1: Login
+    {
+        "name": "Login",
+        "description": "Login to O9 Platform",
+        "expected_result": "User successfully authenticates and sees dashboard",
+        "selenium_script": "# Login script",
+        "script_json": _dumps([
+            {"action": "navigate", "url": "http://localhost:3001", "description": "Navigate to Mock O9"},
+            _wait(2, "Wait for page load"),
+            _input("id", "username", "testuser", "Enter username"),
+            _input("id", "password", "password123", "Enter password"),
+            _click("id", "login-button", "Click login"),
+            _wait(2, "Wait for redirect"),
+            _verify_text("tag", "h1", "Welcome to O9 Platform", "Verify login success")
+        ])
+    },
+    # STEP 2: Verify Dashboard
+    {
+        "name": "Verify Dashboard",
+        "description": "Verify Dashboard Components",
+        "expected_result": "Dashboard displays with widgets and sidebar",
+        "selenium_script": "# Verify dashboard",
+        "script_json": _dumps([
+            _wait(1, "Wait after login"),
+            _verify_present("class", "dashboard-widgets", "Verify widgets container"),
+            _verify_present("class", "sidebar", "Verify sidebar")
+        ])
+    },
+    # STEP 3: Click Demand Analyst - FIXED SELECTOR
+    {
+        "name": "Expand Demand Analyst (FIXED)",
+        "description": "Expand Demand Analyst Menu",
+        "expected_result": "Demand Analyst submenu expands with active class",
+        "selenium_script": "# Expand Demand Analyst",
+        "script_json": _dumps([
+            _wait(1, "Wait after login"),
+            _click("xpath", XP_DEMAND_ANALYST, "Click Demand Analyst menu (using span/parent selector)"),
+            _wait(1, "Wait for submenu to expand"),
+            _verify_present("id", "demand-analyst", "Verify Demand Analyst submenu exists")
+        ])
+    },
+    # STEP 4: Click System Forecast - FIXED SELECTOR
+    {
+        "name": "System Forecast (FIXED)",
+        "description": "Expand System Forecast Submenu",
+        "expected_result": "System Forecast submenu expands",
+        "selenium_script": "# Expand System Forecast",
+        "script_json": _dumps([
+            _wait(1, "Wait after login"),
+            _click("xpath", XP_DEMAND_ANALYST, "Expand Demand Analyst"),
+            _wait(1, "Wait for submenu"),
+            _click("xpath", XP_SYSTEM_FORECAST, "Click System Forecast submenu item (using onclick attribute)"),
+            _wait(1, "Wait for submenu"),
+            _verify_present("id", "system-forecast", "Verify System Forecast submenu exists")
+        ])
+    },
+    # STEP 5: Navigate to Forecast Page
+    {
+        "name": "Navigate to Forecast",
+        "description": "Navigate to Forecast Details Page",
+        "expected_result": "Forecast page loads successfully",
+        "selenium_script": "# Navigate to forecast",
+        "script_json": _dumps_after(NAV_FORECAST_JSON, [
+            _verify_text("tag", "h1", "Generate Forecast", "Verify forecast page")
+        ])
+    },
+    # STEP 6: Verify Forecast Page Elements
+    {
+        "name": "Verify Forecast Elements",
+        "description": "Verify Forecast Page Elements",
+        "expected_result": "All filters and controls are present",
+        "selenium_script": "# Verify forecast elements",
+        "script_json": _dumps_after(NAV_FORECAST_JSON, [
+            _verify_present("class", "scope-filters", "Verify filters section"),
+            _verify_present("id", "forecast-iteration", "Verify iteration dropdown"),
+            _verify_present("id", "region", "Verify region dropdown")
+        ])
+    },
+    # STEP 7: Apply Forecast Iteration Filter
+    {
+        "name": "Iteration Filter",
+        "description": "Apply Forecast Iteration Filter",
+        "expected_result": "Forecast Iteration set to Short Term",
+        "selenium_script": "# Apply filter",
+        "script_json": _dumps_after(NAV_FORECAST_JSON, [
+            _click("id", "forecast-iteration", "Click Forecast Iteration dropdown"),
+            _click("xpath", "//select[@id='forecast-iteration']/option[@value='short-term']", "Select Short Term"),
+            _wait(1, "Wait after selection")
+        ])
+    },
+    # STEP 8: Apply Region Filter
+    {
+        "name": "Region Filter",
+        "description": "Apply Region Filter",
+        "expected_result": "Region set to North America",
+        "selenium_script": "# Apply region filter",
+        "script_json": _dumps_after(NAV_FORECAST_JSON, [
+            _click("id", "region", "Click Region dropdown"),
+            _click("xpath", "//select[@id='region']/option[@value='na']", "Select North America"),
+            _wait(1, "Wait")
+        ])
+    },
+    # STEP 9: Verify Forecast Widgets
+    {
+        "name": "Verify Widgets",
+        "description": "Verify Forecast Widgets",
+        "expected_result": "Review and Gap widgets visible",
+        "selenium_script": "# Verify widgets",
+        "script_json": _dumps_after(NAV_FORECAST_JSON, [
+            _verify_present("class", "review-widget", "Verify Review Widget"),
+            _verify_present("class", "gap-widget", "Verify Gap Widget"),
+            _verify_present("class", "data-table", "Verify data table")
+        ])
+    },
+    # STEP 10: Navigate to BOM Setup
+    {
+        "name": "BOM Setup",
+        "description": "Navigate to BOM Setup",
+        "expected_result": "BOM Setup page loads",
+        "selenium_script": "# Navigate to BOM",
+        "script_json": _dumps_after(NAV_BOM_JSON, [
+            _verify_text("tag", "h1", "BOM Setup", "Verify BOM Setup heading")
+        ])
+    },
+    # STEP 11: Apply BOM Filters
+    {
+        "name": "BOM Filters",
+        "description": "Apply BOM Filters",
+        "expected_result": "Version and Item filters applied",
+        "selenium_script": "# Apply BOM filters",
+        "script_json": _dumps_after(NAV_BOM_JSON, [
+            _click("id", "version-bom", "Click Version dropdown"),
+            _click("xpath", "//select[@id='version-bom']/option[@value='current']", "Select CurrentWorkingView"),
+            _input("id", "item", "440000849200", "Enter item ID"),
+            _wait(1, "Wait")
+        ])
+    },
+    # STEP 12: Verify BOM Data
+    {
+        "name": "Verify BOM Data",
+        "description": "Verify BOM Data",
+        "expected_result": "BOM data table displays correctly",
+        "selenium_script": "# Verify BOM data",
+        "script_json": _dumps_after(NAV_BOM_JSON, [
+            _verify_present("class", "data-table", "Verify Produced Items table"),
+            _verify_present("class", "btn-link", "Verify action links"),
+            _verify_present("id", "consumed-items", "Verify consumed items section")
+        ])
+    }
+]
+
+
+# init_db() runs create_all(), which inspects every table; once per process
+# is enough when create_fixed_test() is called repeatedly
+_db_initialized = False
+
+
 def create_fixed_test():
-    init_db()
-    db = SessionLocal()
+    global _db_initialized
+    if not _db_initialized:
+        init_db()
+        _db_initialized = True
     
     try:
-        tc = TestCase(
-            name="Mock O9 - Fixed Menu Navigation Test",
-            description="Test case with properly targeted selectors for Mock O9 website structure. Each step includes proper login and navigation context.",
-            status=TestCaseStatus.APPROVED,
-            requirements="Mock O9 running on http://localhost:3001",
-            assigned_to="Test Automation Team"
-        )
-        db.add(tc)
-        db.flush()
-        
-        print(f"\n{'='*80}")
-        print(f"Creating Fixed Test Case")
-        print(f"{'='*80}\n")
-        
-        # ===================================================================
-        # STEP 1: Login
-        # ===================================================================
-        step1_json = json.dumps([
-            {"action": "navigate", "url": "http://localhost:3001", "description": "Navigate to Mock O9"},
-            {"action": "wait", "duration": 2, "description": "Wait for page load"},
-            {"action": "input", "locator_type": "id", "locator_value": "username", "text": "testuser", "description": "Enter username"},
-            {"action": "input", "locator_type": "id", "locator_value": "password", "text": "password123", "description": "Enter password"},
-            {"action": "click", "locator_type": "id", "locator_value": "login-button", "description": "Click login"},
-            {"action": "wait", "duration": 2, "description": "Wait for redirect"},
-            {"action": "verify_text", "locator_type": "tag", "locator_value": "h1", "expected_text": "Welcome to O9 Platform", "description": "Verify login success"}
-        ], indent=2)
-        
-        step1 = TestStep(
-            test_case_id=tc.id,
-            step_number=1,
-            description="Login to O9 Platform",
-            expected_result="User successfully authenticates and sees dashboard",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Login script",
-            selenium_script_json=step1_json
-        )
-        db.add(step1)
-        print("✓ Step 1: Login")
-        
-        # ===================================================================
-        # STEP 2: Verify Dashboard
-        # ===================================================================
-        step2_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait after login"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "dashboard-widgets", "description": "Verify widgets container"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "sidebar", "description": "Verify sidebar"}
-        ], indent=2)
-        
-        step2 = TestStep(
-            test_case_id=tc.id,
-            step_number=2,
-            description="Verify Dashboard Components",
-            expected_result="Dashboard displays with widgets and sidebar",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify dashboard",
-            selenium_script_json=step2_json
-        )
-        db.add(step2)
-        print("✓ Step 2: Verify Dashboard")
-        
-        # ===================================================================
-        # STEP 3: Click Demand Analyst - FIXED SELECTOR
-        # ===================================================================
-        step3_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait after login"},
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//span[text()='Demand Analyst']/parent::a",
-                "description": "Click Demand Analyst menu (using span/parent selector)"
-            },
-            {"action": "wait", "duration": 1, "description": "Wait for submenu to expand"},
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "demand-analyst",
-                "description": "Verify Demand Analyst submenu exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "demand-analyst",
-                "description": "Verify Demand Analyst submenu exists (will check if visible)"
-            }
-        ], indent=2)
-        
-        step3 = TestStep(
-            test_case_id=tc.id,
-            step_number=3,
-            description="Expand Demand Analyst Menu",
-            expected_result="Demand Analyst submenu expands with active class",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Expand Demand Analyst",
-            selenium_script_json=step3_json
-        )
-        db.add(step3)
-        print("✓ Step 3: Expand Demand Analyst (FIXED)")
-        
-        # ===================================================================
-        # STEP 4: Click System Forecast - FIXED SELECTOR
-        # ===================================================================
-        step4_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait after login"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Expand Demand Analyst"},
-            {"action": "wait", "duration": 1, "description": "Wait for submenu"},
-            {
-                "action": "click",
-                "locator_type": "xpath",
-                "locator_value": "//a[contains(@onclick, 'system-forecast')]",
-                "description": "Click System Forecast submenu item (using onclick attribute)"
-            },
-            {"action": "wait", "duration": 1, "description": "Wait for submenu"},
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "system-forecast",
-                "description": "Verify System Forecast submenu exists"
-            },
-            {
-                "action": "verify_element_present",
-                "locator_type": "id",
-                "locator_value": "system-forecast",
-                "description": "Verify System Forecast submenu exists"
+        # Test case and steps share one transaction: it commits when the
+        # block exits and rolls back if anything inside raises
+        with SessionLocal.begin() as db:
+            # Plain INSERT ... RETURNING id; no ORM object to add and flush
+            tc_id = db.execute(insert(TestCase).returning(TestCase.id), {
+                "name": "Mock O9 - Fixed Menu Navigation Test",
+                "description": "Test case with properly targeted selectors for Mock O9 website structure. Each step includes proper login and navigation context.",
+                "status": TestCaseStatus.APPROVED,
+                "requirements": "Mock O9 running on http://localhost:3001",
+                "assigned_to": "Test Automation Team"
+            }).scalar_one()
+            
+            print(f"\n{'='*80}")
+            print(f"Creating Fixed Test Case")
+            print(f"{'='*80}\n")
+            
+            # Columns that are the same for every step row
+            base = {
+                "test_case_id": tc_id,
+                "status": TestStepStatus.NOT_STARTED,
+                "execution_status": ExecutionStatus.NOT_RUN,
             }
-        ], indent=2)
-        
-        step4 = TestStep(
-            test_case_id=tc.id,
-            step_number=4,
-            description="Expand System Forecast Submenu",
-            expected_result="System Forecast submenu expands",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Expand System Forecast",
-            selenium_script_json=step4_json
-        )
-        db.add(step4)
-        print("✓ Step 4: System Forecast (FIXED)")
-        
-        # ===================================================================
-        # STEP 5: Navigate to Forecast Page
-        # ===================================================================
-        step5_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Expand Demand Analyst"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'system-forecast')]", "description": "Expand System Forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'generate-forecast')]", "description": "Expand Generate Forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='forecast.html']", "description": "Click Details link"},
-            {"action": "wait", "duration": 2, "description": "Wait for page load"},
-            {"action": "verify_text", "locator_type": "tag", "locator_value": "h1", "expected_text": "Generate Forecast", "description": "Verify forecast page"}
-        ], indent=2)
-        
-        step5 = TestStep(
-            test_case_id=tc.id,
-            step_number=5,
-            description="Navigate to Forecast Details Page",
-            expected_result="Forecast page loads successfully",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to forecast",
-            selenium_script_json=step5_json
-        )
-        db.add(step5)
-        print("✓ Step 5: Navigate to Forecast")
-        
-        # ===================================================================
-        # STEP 6: Verify Forecast Page Elements
-        # ===================================================================
-        step6_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Navigate to forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'system-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'generate-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='forecast.html']", "description": "Go to page"},
-            {"action": "wait", "duration": 2, "description": "Wait for page"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "scope-filters", "description": "Verify filters section"},
-            {"action": "verify_element_present", "locator_type": "id", "locator_value": "forecast-iteration", "description": "Verify iteration dropdown"},
-            {"action": "verify_element_present", "locator_type": "id", "locator_value": "region", "description": "Verify region dropdown"}
-        ], indent=2)
-        
-        step6 = TestStep(
-            test_case_id=tc.id,
-            step_number=6,
-            description="Verify Forecast Page Elements",
-            expected_result="All filters and controls are present",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify forecast elements",
-            selenium_script_json=step6_json
-        )
-        db.add(step6)
-        print("✓ Step 6: Verify Forecast Elements")
-        
-        # ===================================================================
-        # STEP 7: Apply Forecast Iteration Filter
-        # ===================================================================
-        step7_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Navigate to forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'system-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'generate-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='forecast.html']", "description": "Go to page"},
-            {"action": "wait", "duration": 2, "description": "Wait for page"},
-            {"action": "click", "locator_type": "id", "locator_value": "forecast-iteration", "description": "Click Forecast Iteration dropdown"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//select[@id='forecast-iteration']/option[@value='short-term']", "description": "Select Short Term"},
-            {"action": "wait", "duration": 1, "description": "Wait after selection"}
-        ], indent=2)
+            
+            steps = []
+            progress = []
+            for step_number, step in enumerate(STEPS, 1):
+                steps.append({
+                    **base,
+                    "step_number": step_number,
+                    "description": step["description"],
+                    "expected_result": step["expected_result"],
+                    "selenium_script": step["selenium_script"],
+                    "selenium_script_json": step["script_json"]
+                })
+                progress.append(f"✓ Step {step_number}: {step['name']}")
+            
+            # Add all steps to database in one executemany INSERT
+            db.execute(insert(TestStep), steps)
         
-        step7 = TestStep(
-            test_case_id=tc.id,
-            step_number=7,
-            description="Apply Forecast Iteration Filter",
-            expected_result="Forecast Iteration set to Short Term",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Apply filter",
-            selenium_script_json=step7_json
-        )
-        db.add(step7)
-        print("✓ Step 7: Iteration Filter")
-        
-        # ===================================================================
-        # STEP 8: Apply Region Filter
-        # ===================================================================
-        step8_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Navigate to forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'system-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'generate-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='forecast.html']", "description": "Go to page"},
-            {"action": "wait", "duration": 2, "description": "Wait"},
-            {"action": "click", "locator_type": "id", "locator_value": "region", "description": "Click Region dropdown"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//select[@id='region']/option[@value='na']", "description": "Select North America"},
-            {"action": "wait", "duration": 1, "description": "Wait"}
-        ], indent=2)
-        
-        step8 = TestStep(
-            test_case_id=tc.id,
-            step_number=8,
-            description="Apply Region Filter",
-            expected_result="Region set to North America",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Apply region filter",
-            selenium_script_json=step8_json
-        )
-        db.add(step8)
-        print("✓ Step 8: Region Filter")
-        
-        # ===================================================================
-        # STEP 9: Verify Forecast Widgets
-        # ===================================================================
-        step9_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Demand Analyst']/parent::a", "description": "Navigate to forecast"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'system-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'generate-forecast')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='forecast.html']", "description": "Go to page"},
-            {"action": "wait", "duration": 2, "description": "Wait for widgets"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "review-widget", "description": "Verify Review Widget"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "gap-widget", "description": "Verify Gap Widget"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "data-table", "description": "Verify data table"}
-        ], indent=2)
-        
-        step9 = TestStep(
-            test_case_id=tc.id,
-            step_number=9,
-            description="Verify Forecast Widgets",
-            expected_result="Review and Gap widgets visible",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify widgets",
-            selenium_script_json=step9_json
-        )
-        db.add(step9)
-        print("✓ Step 9: Verify Widgets")
-        
-        # ===================================================================
-        # STEP 10: Navigate to BOM Setup
-        # ===================================================================
-        step10_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Supply Master Planning']/parent::a", "description": "Expand Supply Planning"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manage-network')]", "description": "Expand Manage Network"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manufacturing-network')]", "description": "Expand Manufacturing Network"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='bom-setup.html']", "description": "Click BOM Setup"},
-            {"action": "wait", "duration": 2, "description": "Wait for BOM page"},
-            {"action": "verify_text", "locator_type": "tag", "locator_value": "h1", "expected_text": "BOM Setup", "description": "Verify BOM Setup heading"}
-        ], indent=2)
-        
-        step10 = TestStep(
-            test_case_id=tc.id,
-            step_number=10,
-            description="Navigate to BOM Setup",
-            expected_result="BOM Setup page loads",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Navigate to BOM",
-            selenium_script_json=step10_json
-        )
-        db.add(step10)
-        print("✓ Step 10: BOM Setup")
-        
-        # ===================================================================
-        # STEP 11: Apply BOM Filters
-        # ===================================================================
-        step11_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Supply Master Planning']/parent::a", "description": "Navigate to BOM"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manage-network')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manufacturing-network')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='bom-setup.html']", "description": "Go to BOM page"},
-            {"action": "wait", "duration": 2, "description": "Wait"},
-            {"action": "click", "locator_type": "id", "locator_value": "version-bom", "description": "Click Version dropdown"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//select[@id='version-bom']/option[@value='current']", "description": "Select CurrentWorkingView"},
-            {"action": "input", "locator_type": "id", "locator_value": "item", "text": "440000849200", "description": "Enter item ID"},
-            {"action": "wait", "duration": 1, "description": "Wait"}
-        ], indent=2)
-        
-        step11 = TestStep(
-            test_case_id=tc.id,
-            step_number=11,
-            description="Apply BOM Filters",
-            expected_result="Version and Item filters applied",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Apply BOM filters",
-            selenium_script_json=step11_json
-        )
-        db.add(step11)
-        print("✓ Step 11: BOM Filters")
-        
-        # ===================================================================
-        # STEP 12: Verify BOM Data
-        # ===================================================================
-        step12_json = json.dumps([
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//span[text()='Supply Master Planning']/parent::a", "description": "Navigate to BOM"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manage-network')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[contains(@onclick, 'manufacturing-network')]", "description": "Expand"},
-            {"action": "wait", "duration": 1, "description": "Wait"},
-            {"action": "click", "locator_type": "xpath", "locator_value": "//a[@href='bom-setup.html']", "description": "Go to BOM"},
-            {"action": "wait", "duration": 2, "description": "Wait"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "data-table", "description": "Verify Produced Items table"},
-            {"action": "verify_element_present", "locator_type": "class", "locator_value": "btn-link", "description": "Verify action links"},
-            {"action": "verify_element_present", "locator_type": "id", "locator_value": "consumed-items", "description": "Verify consumed items section"}
-        ], indent=2)
-        
-        step12 = TestStep(
-            test_case_id=tc.id,
-            step_number=12,
-            description="Verify BOM Data",
-            expected_result="BOM data table displays correctly",
-            status=TestStepStatus.NOT_STARTED,
-            execution_status=ExecutionStatus.NOT_RUN,
-            selenium_script="# Verify BOM data",
-            selenium_script_json=step12_json
-        )
-        db.add(step12)
-        print("✓ Step 12: Verify BOM Data")
-        
-        db.commit()
-        
-        print(f"\n{'='*80}")
-        print(f"✓ Test case created with FIXED selectors")
-        print(f"{'='*80}")
-        print(f"\nKey Fixes:")
-        print(f"  • Using //span[text()='Demand Analyst']/parent::a for menu clicks")
-        print(f"  • Using //a[contains(@onclick, '...')] for submenu items")
-        print(f"  • Verifying .active class on expanded menus")
-        print(f"  • Every step includes full navigation path from login")
-        print(f"{'='*80}")
-        print(f"\nTest Case ID: {tc.id}")
-        print(f"Access: http://localhost:5173/test-case/{tc.id}")
-        print(f"{'='*80}\n")
+        # Step progress and the summary each go out in one write once the
+        # steps are committed
+        sys.stdout.write("\n".join(progress) + "\n")
+        print(f"""
+{'='*80}
+✓ Test case created with FIXED selectors
+{'='*80}
+
+Key Fixes:
+  • Using //span[text()='Demand Analyst']/parent::a for menu clicks
+  • Using //a[contains(@onclick, '...')] for submenu items
+  • Verifying .active class on expanded menus
+  • Every step includes full navigation path from login
+{'='*80}
+
+Test Case ID: {tc_id}
+Access: http://localhost:5173/test-case/{tc_id}
+{'='*80}
+""", flush=True)
         
-        return tc.id
+        return tc_id
         
     except Exception as e:
-        db.rollback()
         print(f"\n✗ ERROR: {e}")
         import traceback
         traceback.print_exc()
         return None
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     create_fixed_test()